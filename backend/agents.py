@@ -4,29 +4,54 @@ Implements the six-phase spec-driven development workflow.
 """
 
 import asyncio
+import functools
+import hashlib
+import json
+import logging
+import operator
 import os
-from queue import Queue
-from threading import Thread
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from queue import SimpleQueue
+from threading import Lock, local
 from typing import Callable, Optional
 
-from crewai import Agent, Crew, Process, Task
-
-from db import add_log, get_feature, get_project_by_id, update_feature_status
+import httpx
+from asyncio_throttle import Throttler
+from cachetools import LRUCache
+from crewai import LLM, Agent, Crew, Process, Task
+
+try:
+    import litellm
+except ImportError:  # CrewAI versions that don't ship litellm
+    litellm = None
+
+import feature_cache
+import prompts
+from db import (
+    get_cached_llm_response,
+    get_feature,
+    get_project_by_id,
+    put_cached_llm_response,
+    update_feature_status,
+)
+from log_batcher import batcher as log_batcher
 from models import PhaseStatus, WorkflowPhase
-from tools import (
+import tools_cached
+from tools import git_commit, git_diff, git_status, run_tests
+from tools_cached import (
     check_docker_standards,
     create_directory,
     edit_file,
-    git_commit,
-    git_diff,
-    git_status,
     list_directory,
     read_file,
-    run_tests,
     search_files,
     write_file,
 )
-from utils import backup_spec, update_phase_status, write_phase_spec
+from utils import backup_spec, get_phase_file, update_phase_status, write_phase_spec
 
 # Environment configuration
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
@@ -34,24 +59,250 @@ MODEL_OPUS = os.getenv("CLAUDE_MODEL_OPUS", "claude-3-opus-20240229")
 MODEL_SONNET = os.getenv("CLAUDE_MODEL_SONNET", "claude-3-5-sonnet-20241022")
 MODEL_HAIKU = os.getenv("CLAUDE_MODEL_HAIKU", "claude-3-haiku-20240307")
 
+# Precomputed litellm model identifiers
+LLM_OPUS = f"anthropic/{MODEL_OPUS}"
+LLM_SONNET = f"anthropic/{MODEL_SONNET}"
+LLM_HAIKU = f"anthropic/{MODEL_HAIKU}"
+
+# Cap on concurrent Anthropic calls per workflow (account RPM limits)
+MAX_CONCURRENT_LLM_CALLS = int(os.getenv("CF_MAX_CONCURRENT_LLM_CALLS", "4"))
+
+# Requests-per-minute budget for Anthropic calls, shared by all workflows,
+# and the retry cap for rate-limited calls
+ANTHROPIC_RPM = int(os.getenv("CF_ANTHROPIC_RPM", "50"))
+
+# Escape hatch for auditing: skip the content-addressed response cache
+LLM_CACHE_DISABLED = os.getenv("CF_DISABLE_LLM_CACHE", "") == "1"
+LLM_MAX_RETRIES = 3
+
+_rate_limiter = Throttler(rate_limit=ANTHROPIC_RPM, period=60.0)
+
+# One keep-alive connection pool to api.anthropic.com shared by every
+# agent, instead of litellm building a client per agent. httpx.Client is
+# thread-safe, so the workflow worker threads can share it.
+_shared_http = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+)
+if litellm is not None:
+    litellm.client_session = _shared_http
+
+# Anthropic prompt-caching beta header. On its own this only opts the
+# request into the beta API surface: the server caches nothing until the
+# prompt carries explicit cache_control breakpoints, and CrewAI offers
+# no seam to attach those to the backstory/system blocks it assembles.
+# Kept as groundwork; _log_cache_reads will report hits if a future
+# CrewAI/litellm version starts injecting the markers.
+_ANTHROPIC_BETA_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_llm(model: str) -> LLM:
+    """One LLM instance per model string."""
+    return LLM(model=model, extra_headers=_ANTHROPIC_BETA_HEADERS)
+
+
+def _model_id(agent: Agent) -> str:
+    """Stable model identifier for an agent, usable as a cache key."""
+    llm = getattr(agent, "llm", None)
+    return getattr(llm, "model", None) or str(llm)
+
+
+# Extractor for crew results, resolved once from the first result's type:
+# CrewOutput shape is stable per CrewAI version, so there is no need to
+# re-probe attributes on every phase.
+_result_extractor: Optional[Callable] = None
+
+
+def _extract_content(feat_id: str, result, label: str) -> str:
+    """Pull the raw text out of a crew result.
+
+    An empty result is logged as a warning instead of falling back to
+    str(result), which used to stringify the whole output object graph and
+    hide real failures behind a repr.
+    """
+    global _result_extractor
+    if _result_extractor is None:
+        if hasattr(result, "raw"):
+            _result_extractor = operator.attrgetter("raw")
+        elif hasattr(result, "tasks_output"):
+            _result_extractor = lambda r: r.tasks_output[0].raw  # noqa: E731
+        else:
+            _result_extractor = str
+
+    content = _result_extractor(result) or ""
+    if not content:
+        log_message(
+            feat_id,
+            f"{label} produced empty output ({type(result).__qualname__})",
+            level="warning",
+        )
+    return str(content)
+
+
+def _log_cache_reads(feat_id: str, result, label: str) -> None:
+    """Log how many input tokens the server-side prompt cache served."""
+    usage = getattr(result, "token_usage", None)
+    cached = getattr(usage, "cached_prompt_tokens", 0) or 0
+    if cached:
+        log_message(feat_id, f"Prompt cache served {cached} input tokens for {label}")
+
+
+# Read-only tool set shared by the analysis-oriented agents
+_READ_TOOLS = [read_file, search_files, list_directory]
+
+# Bounded pool for workflow execution; each worker runs one workflow's
+# event loop at a time
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("CF_WORKFLOW_WORKERS", "8")),
+    thread_name_prefix="workflow",
+)
+
+# Bounds on the WebSocket log fanout: at most this many features keep a
+# queue alive, and each queue holds at most this many pending messages.
+LOG_QUEUE_CACHE_SIZE = int(os.getenv("CF_LOG_QUEUE_CACHE_SIZE", "128"))
+LOG_QUEUE_DEPTH = int(os.getenv("CF_LOG_QUEUE_DEPTH", "10000"))
+
+
+# Event loop that owns the WebSocket fanout queues; captured when
+# start_log_listener runs inside the app lifespan. Records produced on
+# the listener thread are handed to it with call_soon_threadsafe so the
+# asyncio.Queues are only ever touched from one loop.
+_ws_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class _LogQueueCache(LRUCache):
+    """LRU of per-feature log queues that drains a queue on eviction."""
+
+    def popitem(self):
+        feat_id, queue = super().popitem()
+        while True:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+        return feat_id, queue
+
+
 # Log queues for WebSocket streaming
-log_queues: dict[str, Queue] = {}
+log_queues: LRUCache = _LogQueueCache(maxsize=LOG_QUEUE_CACHE_SIZE)
 
 
-def get_log_queue(feat_id: str) -> Queue:
-    """Get or create a log queue for a feature."""
+def get_log_queue(feat_id: str) -> asyncio.Queue:
+    """Get or create a bounded log queue for a feature."""
     if feat_id not in log_queues:
-        log_queues[feat_id] = Queue()
+        log_queues[feat_id] = asyncio.Queue(maxsize=LOG_QUEUE_DEPTH)
     return log_queues[feat_id]
 
 
+_LOG_LEVELS = {"debug": logging.DEBUG, "info": logging.INFO,
+               "warning": logging.WARNING, "error": logging.ERROR}
+
+
+class DbBatchHandler(logging.Handler):
+    """Feed log records into the shared LogBatcher.
+
+    Runs on the QueueListener thread, so SQLite write latency never
+    touches the agent threads that produced the records. Batching and
+    debounce policy live in log_batcher.LogBatcher.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        log_batcher.add(
+            record.feat_id,
+            record.getMessage(),
+            record.level_str,
+            timestamp=datetime.utcfromtimestamp(record.created),
+        )
+
+    def flush(self) -> None:
+        log_batcher.flush()
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
+
+
+class WsFanoutHandler(logging.Handler):
+    """Fan log records out to the per-feature WebSocket queues.
+
+    Queues are bounded rings: when a slow consumer lets one fill up, the
+    oldest message is dropped rather than letting the queue grow.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        item = {"message": record.getMessage(), "level": record.level_str}
+        if _ws_loop is not None and not _ws_loop.is_closed():
+            _ws_loop.call_soon_threadsafe(self._put, record.feat_id, item)
+        else:
+            self._put(record.feat_id, item)
+
+    @staticmethod
+    def _put(feat_id: str, item: dict) -> None:
+        queue = get_log_queue(feat_id)
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                pass
+
+
+_agent_logger = logging.getLogger("claudeforge.agents")
+_agent_logger.setLevel(logging.DEBUG)
+_agent_logger.propagate = False
+
+_log_listener: Optional[QueueListener] = None
+_listener_lock = Lock()
+
+
+def start_log_listener() -> None:
+    """Start the background listener that drains log records off the hot path."""
+    global _log_listener, _ws_loop
+    with _listener_lock:
+        if _log_listener is not None:
+            return
+        if _ws_loop is None:
+            try:
+                _ws_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                _ws_loop = None
+        record_queue: SimpleQueue = SimpleQueue()
+        _agent_logger.addHandler(QueueHandler(record_queue))
+        _log_listener = QueueListener(
+            record_queue, DbBatchHandler(), WsFanoutHandler()
+        )
+        _log_listener.start()
+
+
+def stop_log_listener() -> None:
+    """Stop the log listener, flushing any buffered records."""
+    global _log_listener
+    with _listener_lock:
+        if _log_listener is None:
+            return
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
 def log_message(feat_id: str, message: str, level: str = "info") -> None:
-    """Log a message to both database and queue."""
-    add_log(feat_id, message, level)
-    queue = get_log_queue(feat_id)
-    queue.put({"message": message, "level": level})
+    """Log a message to both database and queue via the background listener."""
+    start_log_listener()
+    _agent_logger.log(
+        _LOG_LEVELS.get(level, logging.INFO),
+        message,
+        extra={"feat_id": feat_id, "level_str": level},
+    )
 
 
+@functools.lru_cache(maxsize=1)
 def create_orchestrator() -> Agent:
     """Create the orchestrator agent (Claude Opus)."""
     return Agent(
@@ -61,13 +312,14 @@ def create_orchestrator() -> Agent:
         Your responsibility is to manage the flow between phases: Requirements → Design → Tasks → Implementation → Verification → Review.
         You ensure each phase produces quality specifications before allowing progression.
         You delegate to specialized agents and aggregate their outputs.""",
-        llm=f"anthropic/{MODEL_OPUS}",
+        llm=_cached_llm(LLM_OPUS),
         verbose=True,
         allow_delegation=True,
         tools=[read_file, write_file, list_directory],
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_requirements_analyst() -> Agent:
     """Create the requirements analyst agent (Claude Sonnet)."""
     return Agent(
@@ -76,12 +328,13 @@ def create_requirements_analyst() -> Agent:
         backstory="""You are an expert requirements analyst with deep experience in software specifications.
         You take vague feature requests and transform them into clear, actionable requirements.
         You ask clarifying questions and ensure completeness of requirements documentation.""",
-        llm=f"anthropic/{MODEL_SONNET}",
+        llm=_cached_llm(LLM_SONNET),
         verbose=True,
-        tools=[read_file, search_files, list_directory],
+        tools=_READ_TOOLS,
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_architect() -> Agent:
     """Create the architect agent (Claude Sonnet)."""
     return Agent(
@@ -90,12 +343,13 @@ def create_architect() -> Agent:
         backstory="""You are a seasoned software architect who creates elegant solutions.
         You analyze requirements and propose architectures with clear component diagrams,
         data flows, and integration patterns. You consider existing codebase patterns.""",
-        llm=f"anthropic/{MODEL_SONNET}",
+        llm=_cached_llm(LLM_SONNET),
         verbose=True,
-        tools=[read_file, search_files, list_directory, check_docker_standards],
+        tools=[*_READ_TOOLS, check_docker_standards],
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_task_planner() -> Agent:
     """Create the task planner agent (Claude Sonnet)."""
     return Agent(
@@ -104,12 +358,13 @@ def create_task_planner() -> Agent:
         backstory="""You are an expert at decomposing complex designs into manageable tasks.
         You create clear task definitions with acceptance criteria, dependencies,
         and effort estimates. You ensure tasks are atomic and testable.""",
-        llm=f"anthropic/{MODEL_SONNET}",
+        llm=_cached_llm(LLM_SONNET),
         verbose=True,
         tools=[read_file, list_directory],
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_developer() -> Agent:
     """Create the developer agent (Claude Sonnet)."""
     return Agent(
@@ -118,7 +373,7 @@ def create_developer() -> Agent:
         backstory="""You are an expert software developer who writes clean, maintainable code.
         You follow best practices, write tests, and ensure code quality.
         You commit changes incrementally with clear commit messages.""",
-        llm=f"anthropic/{MODEL_SONNET}",
+        llm=_cached_llm(LLM_SONNET),
         verbose=True,
         tools=[
             read_file,
@@ -133,6 +388,7 @@ def create_developer() -> Agent:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_qa_engineer() -> Agent:
     """Create the QA engineer agent (Claude Sonnet)."""
     return Agent(
@@ -141,12 +397,13 @@ def create_qa_engineer() -> Agent:
         backstory="""You are a meticulous QA engineer who ensures software quality.
         You run tests, verify requirements are met, check for edge cases,
         and report issues with clear reproduction steps.""",
-        llm=f"anthropic/{MODEL_SONNET}",
+        llm=_cached_llm(LLM_SONNET),
         verbose=True,
         tools=[read_file, run_tests, search_files, list_directory],
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_reviewer() -> Agent:
     """Create the reviewer agent (Claude Haiku for quick reviews)."""
     return Agent(
@@ -155,13 +412,108 @@ def create_reviewer() -> Agent:
         backstory="""You are an experienced code reviewer who provides constructive feedback.
         You check for code quality, potential bugs, security issues, and adherence to standards.
         You suggest improvements while being mindful of scope.""",
-        llm=f"anthropic/{MODEL_HAIKU}",
+        llm=_cached_llm(LLM_HAIKU),
         verbose=True,
         tools=[read_file, search_files, git_diff],
     )
 
 
-def execute_phase(
+# Phase outputs kept in memory are capped at the prompt-context limit
+PHASE_SUMMARY_CHARS = prompts.PHASE_SUMMARY_CHARS
+
+
+@dataclass
+class PhaseDigest:
+    """Truncated phase output plus the on-disk spec path.
+
+    Workflows hold only the summary in memory; agents that need the full
+    output can read spec_path lazily with their Read File tool.
+    """
+
+    summary: str
+    spec_path: Path
+
+    def __str__(self) -> str:
+        return self.summary
+
+
+# Crews are reused per (worker thread, agent): constructing a Crew makes
+# CrewAI re-introspect every tool schema, which is pure repeated work for
+# our single-task crews. Thread-local storage keeps reuse safe across the
+# workflow executor threads.
+_thread_crews = local()
+
+
+def _get_crew(agent: Agent) -> Crew:
+    """Get the reusable single-agent Crew for this thread, creating on first use."""
+    crews = getattr(_thread_crews, "crews", None)
+    if crews is None:
+        crews = _thread_crews.crews = {}
+
+    crew = crews.get(id(agent))
+    if crew is None:
+        crew = Crew(
+            agents=[agent],
+            tasks=[],
+            process=Process.sequential,
+            verbose=True,
+        )
+        crews[id(agent)] = crew
+    return crew
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited call, or None if not a 429."""
+    is_rate_limit = (
+        litellm is not None and isinstance(exc, litellm.exceptions.RateLimitError)
+    ) or getattr(exc, "status_code", None) == 429
+    if not is_rate_limit:
+        return None
+
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after", 1.0))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+async def _kickoff_with_retry(feat_id: str, crew: Crew):
+    """Run a crew kickoff under the shared rate limiter, retrying 429s.
+
+    The limiter keeps aggregate request rate just below the account RPM so
+    parallel phases don't stampede; when Anthropic still returns a 429, we
+    sleep exactly the Retry-After the server asked for instead of litellm's
+    exponential backoff, capped at LLM_MAX_RETRIES attempts.
+    """
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        async with _rate_limiter:
+            try:
+                return await crew.kickoff_async()
+            except Exception as e:
+                retry_after = _retry_after_seconds(e)
+                if retry_after is None or attempt == LLM_MAX_RETRIES:
+                    raise
+                log_message(
+                    feat_id,
+                    f"Rate limited by Anthropic, retrying in {retry_after:.0f}s "
+                    f"(attempt {attempt + 1}/{LLM_MAX_RETRIES})",
+                    level="warning",
+                )
+        await asyncio.sleep(retry_after)
+
+
+def warm_agents() -> None:
+    """Populate the agent factory caches so the first workflow doesn't pay the cost."""
+    create_orchestrator()
+    create_requirements_analyst()
+    create_architect()
+    create_task_planner()
+    create_developer()
+    create_qa_engineer()
+    create_reviewer()
+
+
+async def execute_phase(
     feat_id: str,
     project_name: str,
     phase: WorkflowPhase,
@@ -169,7 +521,8 @@ def execute_phase(
     description: str,
     context_content: str = "",
     auto_approve: bool = False,
-) -> str:
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> PhaseDigest:
     """
     Execute a single workflow phase and persist output to spec file.
 
@@ -181,12 +534,16 @@ def execute_phase(
         description: Task description for the agent
         context_content: Content from previous phases for context
         auto_approve: If True, auto-approve the phase
+        semaphore: Optional cap on concurrent LLM calls when phases overlap
 
     Returns:
-        The phase output content
+        Digest with the truncated output and the spec file path
     """
     log_message(feat_id, f"Executing phase: {phase.value}")
 
+    # Scope tool-result caching to this workflow's feature
+    tools_cached.current_feat_id.set(feat_id)
+
     # Create task for this phase
     task = Task(
         description=description,
@@ -194,30 +551,30 @@ def execute_phase(
         agent=agent,
     )
 
-    # Create single-task crew for this phase
-    crew = Crew(
-        agents=[agent],
-        tasks=[task],
-        process=Process.sequential,
-        verbose=True,
-    )
+    # Identical prompts to the same model are served from the response cache
+    model = _model_id(agent)
+    prompt_hash = hashlib.sha256(description.encode()).hexdigest()
+    content = None if LLM_CACHE_DISABLED else get_cached_llm_response(prompt_hash, model)
 
-    # Execute the task
-    result = crew.kickoff()
-
-    # Extract output - try multiple approaches
-    content = ""
-    if hasattr(result, 'raw') and result.raw:
-        content = str(result.raw)
-    elif hasattr(result, 'tasks_output') and result.tasks_output:
-        # Get the first (and only) task output
-        task_output = result.tasks_output[0]
-        if hasattr(task_output, 'raw'):
-            content = str(task_output.raw)
-        else:
-            content = str(task_output)
+    if content is not None:
+        log_message(feat_id, f"Phase {phase.value} served from LLM response cache")
     else:
-        content = str(result)
+        # Reuse this thread's crew for the agent, swapping in the phase task
+        crew = _get_crew(agent)
+        crew.tasks = [task]
+
+        # Execute the task without blocking the loop so independent phases overlap
+        if semaphore is not None:
+            async with semaphore:
+                result = await _kickoff_with_retry(feat_id, crew)
+        else:
+            result = await _kickoff_with_retry(feat_id, crew)
+
+        content = _extract_content(feat_id, result, f"Phase {phase.value}")
+        _log_cache_reads(feat_id, result, f"phase {phase.value}")
+
+        if not LLM_CACHE_DISABLED:
+            put_cached_llm_response(prompt_hash, model, content)
 
     log_message(feat_id, f"Phase {phase.value} generated {len(content)} characters of output")
 
@@ -235,10 +592,120 @@ def execute_phase(
             project_name, feat_id, phase, PhaseStatus.COMPLETED, comment="Auto-approved", user="system"
         )
 
-    return content
+    # Keep only a bounded summary in memory; the full output lives on disk
+    return PhaseDigest(
+        summary=content[:PHASE_SUMMARY_CHARS],
+        spec_path=get_phase_file(project_name, feat_id, phase),
+    )
+
+
+def same_llm(*agents: Agent) -> bool:
+    """Check whether all given agents are configured with the same LLM."""
+    return len({_model_id(a) for a in agents}) == 1
+
+
+async def execute_phase_bundle(
+    feat_id: str,
+    project_name: str,
+    phases: list[tuple[WorkflowPhase, Agent, str]],
+    auto_approve: bool = True,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> dict[str, PhaseDigest]:
+    """
+    Execute several consecutive phases as one batched LLM call.
+
+    Used on the auto-approve path when the phases share the same model and
+    no human gate sits between them: the sub-prompts are concatenated into
+    a single Task and the model returns a JSON object with one section per
+    phase. Each section is persisted exactly as execute_phase would do.
+
+    Args:
+        feat_id: Feature ID
+        project_name: Project name
+        phases: (phase, agent, description) triples, in dependency order
+        auto_approve: If True, auto-approve each bundled phase
+        semaphore: Optional cap on concurrent LLM calls
+
+    Returns:
+        Mapping of phase name to PhaseDigest.
+
+    Raises:
+        ValueError: If the model response is not the expected JSON bundle.
+    """
+    phase_names = [phase.value for phase, _, _ in phases]
+    log_message(feat_id, f"Executing batched phases: {', '.join(phase_names)}")
+    tools_cached.current_feat_id.set(feat_id)
+
+    sections = [
+        f"=== Section {i}: {phase.value} ===\n{description}"
+        for i, (phase, _, description) in enumerate(phases, 1)
+    ]
+    bundle_desc = (
+        "Complete the following workflow phases in order. Each phase builds "
+        "on the output of the previous section.\n\n" + "\n\n".join(sections)
+    )
+
+    agent = phases[0][1]
+    task = Task(
+        description=bundle_desc,
+        expected_output=(
+            "JSON object with keys "
+            + ", ".join(phase_names)
+            + ", each containing that phase's specification as a YAML string"
+        ),
+        agent=agent,
+    )
+    model = _model_id(agent)
+    prompt_hash = hashlib.sha256(bundle_desc.encode()).hexdigest()
+    raw = None if LLM_CACHE_DISABLED else get_cached_llm_response(prompt_hash, model)
+
+    if raw is None:
+        crew = _get_crew(agent)
+        crew.tasks = [task]
+
+        if semaphore is not None:
+            async with semaphore:
+                result = await _kickoff_with_retry(feat_id, crew)
+        else:
+            result = await _kickoff_with_retry(feat_id, crew)
+
+        raw = _extract_content(feat_id, result, "Batched phases")
+        _log_cache_reads(feat_id, result, "batched phases")
+        if not LLM_CACHE_DISABLED:
+            put_cached_llm_response(prompt_hash, model, raw)
+    else:
+        log_message(feat_id, "Batched phases served from LLM response cache")
+
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Batched phase output is not valid JSON: {e}") from e
+
+    missing = [name for name in phase_names if name not in parsed]
+    if missing:
+        raise ValueError(f"Batched phase output missing sections: {', '.join(missing)}")
+
+    outputs = {}
+    status = PhaseStatus.COMPLETED if auto_approve else PhaseStatus.PENDING_APPROVAL
+    for phase, _, _ in phases:
+        content = str(parsed[phase.value])
+        write_phase_spec(project_name, feat_id, phase, content, status=status)
+        log_message(feat_id, f"Wrote spec file for phase: {phase.value}")
+        update_feature_status(feat_id, PhaseStatus.IN_PROGRESS, phase)
+        if auto_approve:
+            update_phase_status(
+                project_name, feat_id, phase, PhaseStatus.COMPLETED,
+                comment="Auto-approved", user="system",
+            )
+        outputs[phase.value] = PhaseDigest(
+            summary=content[:PHASE_SUMMARY_CHARS],
+            spec_path=get_phase_file(project_name, feat_id, phase),
+        )
+
+    return outputs
 
 
-def run_workflow(
+async def run_workflow_async(
     feat_id: str,
     project_name: str,
     description: str,
@@ -246,7 +713,12 @@ def run_workflow(
     auto_approve: bool = False,
 ) -> dict:
     """
-    Run the full workflow for a feature.
+    Run the full workflow for a feature as an async phase DAG.
+
+    Requirements → Design → Tasks → Implementation form a strict dependency
+    chain, but Verification and Review both only need the implementation
+    output, so they run concurrently via asyncio.gather. A semaphore caps
+    concurrent Anthropic calls at MAX_CONCURRENT_LLM_CALLS.
 
     Args:
         feat_id: The feature ID
@@ -262,6 +734,7 @@ def run_workflow(
 
     results = {}
     phase_outputs = {}  # Store outputs for context in later phases
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
 
     try:
         # Create agents once for all phases
@@ -276,164 +749,130 @@ def run_workflow(
         update_feature_status(feat_id, PhaseStatus.IN_PROGRESS, WorkflowPhase.REQUIREMENTS)
 
         # Phase 1: Requirements
-        log_message(feat_id, "Phase 1/6: Gathering requirements")
-        requirements_desc = f"""Analyze the following feature request and create comprehensive requirements:
-
-Feature: {description}
-Project: {project_name}
-Feature ID: {feat_id}
-
-Create a requirements specification that includes:
-1. Functional requirements (what the feature should do)
-2. Non-functional requirements (performance, security, etc.)
-3. User stories or use cases
-4. Acceptance criteria
-5. Dependencies and constraints
-6. Out of scope items
-
-Output the requirements as a structured YAML-compatible specification."""
-
-        phase_outputs['requirements'] = execute_phase(
-            feat_id, project_name, WorkflowPhase.REQUIREMENTS,
-            analyst, requirements_desc, auto_approve=auto_approve
+        requirements_desc = prompts.render(
+            "requirements",
+            feature=description, project=project_name, feat_id=feat_id,
         )
+
+        # With auto-approve there is no human gate between Requirements,
+        # Design, and Tasks — when all three agents share the same model,
+        # collapse them into one batched call to save two LLM roundtrips.
+        if auto_approve and same_llm(analyst, architect, planner):
+            log_message(feat_id, "Phases 1-3/6: Batching requirements/design/tasks")
+            bundle_design_desc = prompts.render(
+                "bundle_design",
+                feature=description, project=project_name, feat_id=feat_id,
+            )
+
+            bundle_tasks_desc = prompts.render(
+                "bundle_tasks", project=project_name, feat_id=feat_id,
+            )
+
+            try:
+                phase_outputs.update(await execute_phase_bundle(
+                    feat_id,
+                    project_name,
+                    [
+                        (WorkflowPhase.REQUIREMENTS, analyst, requirements_desc),
+                        (WorkflowPhase.DESIGN, architect, bundle_design_desc),
+                        (WorkflowPhase.TASKS, planner, bundle_tasks_desc),
+                    ],
+                    auto_approve=auto_approve,
+                    semaphore=semaphore,
+                ))
+            except ValueError as e:
+                log_message(
+                    feat_id,
+                    f"Batched phase call failed, falling back to sequential: {e}",
+                    level="error",
+                )
+
+        if 'requirements' not in phase_outputs:
+            log_message(feat_id, "Phase 1/6: Gathering requirements")
+            phase_outputs['requirements'] = await execute_phase(
+                feat_id, project_name, WorkflowPhase.REQUIREMENTS,
+                analyst, requirements_desc, auto_approve=auto_approve,
+                semaphore=semaphore,
+            )
         results['requirements'] = {"status": "completed" if auto_approve else "pending_approval"}
 
         # Phase 2: Design
-        log_message(feat_id, "Phase 2/6: Creating architectural design")
-        design_desc = f"""Based on the requirements, create an architectural design:
-
-Feature: {description}
-Feature ID: {feat_id}
-Project: {project_name}
-
-Previous Phase - Requirements:
-{phase_outputs['requirements'][:2000]}
-
-The design should include:
-1. High-level architecture overview
-2. Component diagram (in Mermaid format)
-3. Data models and schemas
-4. API contracts (if applicable)
-5. Integration points with existing code
-6. Technology decisions and rationale
-
-Output as a structured design document."""
-
-        phase_outputs['design'] = execute_phase(
-            feat_id, project_name, WorkflowPhase.DESIGN,
-            architect, design_desc, phase_outputs['requirements'], auto_approve
-        )
+        if 'design' not in phase_outputs:
+            log_message(feat_id, "Phase 2/6: Creating architectural design")
+            design_desc = prompts.render(
+                "design",
+                feature=description, project=project_name, feat_id=feat_id,
+                requirements=phase_outputs['requirements'],
+            )
+
+            phase_outputs['design'] = await execute_phase(
+                feat_id, project_name, WorkflowPhase.DESIGN,
+                architect, design_desc, phase_outputs['requirements'].summary, auto_approve,
+                semaphore=semaphore,
+            )
         results['design'] = {"status": "completed" if auto_approve else "pending_approval"}
 
         # Phase 3: Tasks
-        log_message(feat_id, "Phase 3/6: Breaking down into tasks")
-        tasks_desc = f"""Break down the design into implementation tasks:
-
-Feature ID: {feat_id}
-Project: {project_name}
-
-Previous Phase - Design:
-{phase_outputs['design'][:2000]}
-
-Create a task list that includes:
-1. Task ID and title
-2. Description and acceptance criteria
-3. Files to create or modify
-4. Dependencies on other tasks
-5. Estimated complexity (low/medium/high)
-6. Test requirements
-
-Output as a structured task list."""
-
-        phase_outputs['tasks'] = execute_phase(
-            feat_id, project_name, WorkflowPhase.TASKS,
-            planner, tasks_desc, phase_outputs['design'], auto_approve
-        )
+        if 'tasks' not in phase_outputs:
+            log_message(feat_id, "Phase 3/6: Breaking down into tasks")
+            tasks_desc = prompts.render(
+                "tasks",
+                project=project_name, feat_id=feat_id,
+                design=phase_outputs['design'],
+            )
+
+            phase_outputs['tasks'] = await execute_phase(
+                feat_id, project_name, WorkflowPhase.TASKS,
+                planner, tasks_desc, phase_outputs['design'].summary, auto_approve,
+                semaphore=semaphore,
+            )
         results['tasks'] = {"status": "completed" if auto_approve else "pending_approval"}
 
         # Phase 4: Implementation
         log_message(feat_id, "Phase 4/6: Implementing feature")
-        impl_desc = f"""Implement the feature according to the task breakdown:
-
-Feature ID: {feat_id}
-Project: {project_name}
-Project Path: /projects/{project_name}
-
-Previous Phase - Tasks:
-{phase_outputs['tasks'][:2000]}
-
-For each task:
-1. Read existing code to understand context
-2. Write or modify code as needed
-3. Write tests for new functionality
-4. Commit changes with clear messages
-5. Document any deviations from the plan
-
-Follow coding standards and best practices."""
+        impl_desc = prompts.render(
+            "implementation",
+            project=project_name, feat_id=feat_id,
+            tasks=phase_outputs['tasks'],
+        )
 
-        phase_outputs['implementation'] = execute_phase(
+        phase_outputs['implementation'] = await execute_phase(
             feat_id, project_name, WorkflowPhase.IMPLEMENTATION,
-            developer, impl_desc, phase_outputs['tasks'], auto_approve
+            developer, impl_desc, phase_outputs['tasks'].summary, auto_approve,
+            semaphore=semaphore,
         )
         results['implementation'] = {"status": "completed" if auto_approve else "pending_approval"}
 
-        # Phase 5: Verification
+        # Phases 5 and 6 both depend only on the implementation output, so
+        # verification and review run concurrently.
         log_message(feat_id, "Phase 5/6: Verifying implementation")
-        verify_desc = f"""Verify the implementation:
-
-Feature ID: {feat_id}
-Project: {project_name}
-Project Path: /projects/{project_name}
-
-Original Requirements:
-{phase_outputs['requirements'][:1000]}
-
-Implementation Summary:
-{phase_outputs['implementation'][:1000]}
-
-Verification steps:
-1. Run all tests and report results
-2. Verify each requirement is met
-3. Check for edge cases
-4. Identify any bugs or issues
-5. Validate code quality
-
-Report findings with pass/fail status for each item."""
-
-        phase_outputs['verification'] = execute_phase(
-            feat_id, project_name, WorkflowPhase.VERIFICATION,
-            qa, verify_desc, phase_outputs['implementation'], auto_approve
+        verify_desc = prompts.render(
+            "verification",
+            project=project_name, feat_id=feat_id,
+            requirements=phase_outputs['requirements'],
+            implementation=phase_outputs['implementation'],
         )
-        results['verification'] = {"status": "completed" if auto_approve else "pending_approval"}
 
-        # Phase 6: Review
         log_message(feat_id, "Phase 6/6: Reviewing implementation")
-        review_desc = f"""Review the implementation:
-
-Feature ID: {feat_id}
-Project: {project_name}
-
-Implementation Summary:
-{phase_outputs['implementation'][:1000]}
-
-Verification Results:
-{phase_outputs['verification'][:1000]}
-
-Review for:
-1. Code quality and maintainability
-2. Adherence to design patterns
-3. Security considerations
-4. Performance implications
-5. Documentation completeness
-6. Improvement suggestions
-
-Provide constructive feedback with specific recommendations."""
+        review_desc = prompts.render(
+            "review",
+            project=project_name, feat_id=feat_id,
+            implementation=phase_outputs['implementation'],
+        )
 
-        phase_outputs['review'] = execute_phase(
-            feat_id, project_name, WorkflowPhase.REVIEW,
-            reviewer, review_desc, phase_outputs['verification'], auto_approve
+        phase_outputs['verification'], phase_outputs['review'] = await asyncio.gather(
+            execute_phase(
+                feat_id, project_name, WorkflowPhase.VERIFICATION,
+                qa, verify_desc, phase_outputs['implementation'].summary, auto_approve,
+                semaphore=semaphore,
+            ),
+            execute_phase(
+                feat_id, project_name, WorkflowPhase.REVIEW,
+                reviewer, review_desc, phase_outputs['implementation'].summary, auto_approve,
+                semaphore=semaphore,
+            ),
         )
+        results['verification'] = {"status": "completed" if auto_approve else "pending_approval"}
         results['review'] = {"status": "completed" if auto_approve else "pending_approval"}
 
         # Mark workflow as complete
@@ -460,6 +899,25 @@ Provide constructive feedback with specific recommendations."""
             "error": error_msg,
         }
 
+    # The fanout queue is deliberately NOT closed here: the final
+    # log_message calls above are still in flight on the listener thread,
+    # and popping the queue now would recreate it under connected
+    # followers and lose the tail of the stream. The LRU cache reclaims
+    # idle queues instead.
+
+
+def run_workflow(
+    feat_id: str,
+    project_name: str,
+    description: str,
+    project_id: int,
+    auto_approve: bool = False,
+) -> dict:
+    """Run the full workflow synchronously (blocking wrapper for the async DAG)."""
+    return asyncio.run(
+        run_workflow_async(feat_id, project_name, description, project_id, auto_approve)
+    )
+
 
 def start_workflow_async(
     feat_id: str,
@@ -467,14 +925,16 @@ def start_workflow_async(
     description: str,
     project_id: int,
     auto_approve: bool = False,
-) -> None:
-    """Start workflow in a background thread."""
+) -> Future:
+    """Submit the workflow to the shared executor pool."""
+    return _executor.submit(
+        run_workflow, feat_id, project_name, description, project_id, auto_approve
+    )
 
-    def run():
-        run_workflow(feat_id, project_name, description, project_id, auto_approve)
 
-    thread = Thread(target=run, daemon=True)
-    thread.start()
+def shutdown_workflows(wait: bool = True) -> None:
+    """Shut down the workflow executor, waiting for in-flight workflows."""
+    _executor.shutdown(wait=wait)
 
 
 class WorkflowManager:
@@ -482,6 +942,9 @@ class WorkflowManager:
 
     def __init__(self):
         self._workflows: dict[str, dict] = {}
+        self._completed: LRUCache = LRUCache(maxsize=256)
+        self._running: set[str] = set()
+        self._lock = Lock()
 
     def start(
         self,
@@ -492,19 +955,46 @@ class WorkflowManager:
         auto_approve: bool = False,
     ) -> None:
         """Start a new workflow."""
-        self._workflows[feat_id] = {
-            "status": "running",
-            "project": project_name,
-            "description": description,
-        }
-        start_workflow_async(feat_id, project_name, description, project_id, auto_approve)
+        future = start_workflow_async(
+            feat_id, project_name, description, project_id, auto_approve
+        )
+        with self._lock:
+            self._running.add(feat_id)
+            self._workflows[feat_id] = {
+                "status": "running",
+                "project": project_name,
+                "description": description,
+                "future": future,
+            }
+        future.add_done_callback(lambda _future: self._finish(feat_id))
+
+    def _finish(self, feat_id: str) -> None:
+        """Move a finished workflow out of the running set."""
+        with self._lock:
+            self._running.discard(feat_id)
+            entry = self._workflows.pop(feat_id, None)
+            if entry is not None:
+                entry["status"] = "completed"
+                self._completed[feat_id] = entry
 
     def get_status(self, feat_id: str) -> Optional[dict]:
-        """Get workflow status."""
+        """Get workflow status, preferring the in-process cache over SQLite."""
+        cached = feature_cache.get(feat_id)
+        if cached is not None:
+            status, phase, _ = cached
+            return {
+                "feat_id": feat_id,
+                "status": status.value,
+                "current_phase": phase.value if phase else None,
+            }
+
         feature = get_feature(feat_id)
         if not feature:
             return None
 
+        feature_cache.put(
+            feat_id, feature.status, feature.current_phase, feature.project_id
+        )
         return {
             "feat_id": feat_id,
             "status": feature.status.value,
@@ -512,11 +1002,9 @@ class WorkflowManager:
         }
 
     def list_running(self) -> list[str]:
-        """List all running workflow IDs."""
-        return [
-            fid for fid, data in self._workflows.items()
-            if data.get("status") == "running"
-        ]
+        """List all workflow IDs that are queued or still executing."""
+        with self._lock:
+            return list(self._running)
 
 
 # Global workflow manager instance
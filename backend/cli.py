@@ -3,12 +3,16 @@ ClaudeForge CLI using Typer.
 Provides command-line interface for workflow management.
 """
 
+import asyncio
+import atexit
+import json
 import os
 import sys
 from typing import Optional
 
 import httpx
 import typer
+import websockets
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -23,10 +27,37 @@ console = Console()
 
 API_BASE = os.getenv("API_URL", "http://localhost:8000")
 
-
-def get_api_url(endpoint: str) -> str:
-    """Get full API URL for an endpoint."""
-    return f"{API_BASE}{endpoint}"
+# Shared client: keep-alive and HTTP/2 amortize TLS setup across commands
+_client = httpx.Client(
+    base_url=API_BASE,
+    http2=True,
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=4),
+)
+atexit.register(_client.close)
+
+
+def get_ws_url(endpoint: str) -> str:
+    """Get full WebSocket URL for an endpoint."""
+    scheme = "wss" if API_BASE.startswith("https") else "ws"
+    host = API_BASE.split("://", 1)[-1]
+    return f"{scheme}://{host}{endpoint}"
+
+
+async def _follow_logs(feat_id: str) -> None:
+    """Stream log messages for a feature from the WebSocket endpoint."""
+    async with websockets.connect(get_ws_url(f"/ws/logs/{feat_id}")) as ws:
+        async for raw in ws:
+            data = json.loads(raw)
+            # Keepalive frames carry no content; the server sends one per
+            # 30 idle seconds to probe half-open connections
+            if data.get("level") == "ping":
+                continue
+            message = data.get("message", "")
+            if data.get("level") == "error":
+                console.print(f"  [red]{message}[/red]")
+            else:
+                console.print(f"  {message}")
 
 
 @app.command()
@@ -53,8 +84,8 @@ def start(
         ) as progress:
             task = progress.add_task("Initiating workflow...", total=None)
 
-            response = httpx.post(
-                get_api_url("/api/agents/start"),
+            response = _client.post(
+                "/api/agents/start",
                 json={"project": project, "feature_desc": feature_desc},
                 timeout=30,
             )
@@ -89,8 +120,8 @@ def status(
     try:
         if feat_id:
             # Get specific workflow status
-            response = httpx.get(
-                get_api_url(f"/api/agents/status/{feat_id}"),
+            response = _client.get(
+                f"/api/agents/status/{feat_id}",
                 timeout=10,
             )
 
@@ -119,8 +150,8 @@ def status(
                 raise typer.Exit(1)
         else:
             # List running workflows
-            response = httpx.get(
-                get_api_url("/api/agents/running"),
+            response = _client.get(
+                "/api/agents/running",
                 timeout=10,
             )
 
@@ -151,8 +182,8 @@ def status(
 def projects():
     """List all projects."""
     try:
-        response = httpx.get(
-            get_api_url("/api/projects/list"),
+        response = _client.get(
+            "/api/projects/list",
             timeout=10,
         )
 
@@ -197,7 +228,7 @@ def verify():
     all_ok = True
     for name, endpoint in checks:
         try:
-            response = httpx.get(get_api_url(endpoint), timeout=5)
+            response = _client.get(endpoint, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 status = data.get("status", "ok")
@@ -237,8 +268,8 @@ def logs(
 ):
     """View logs for a workflow."""
     try:
-        response = httpx.get(
-            get_api_url(f"/api/agents/status/{feat_id}"),
+        response = _client.get(
+            f"/api/agents/status/{feat_id}",
             timeout=10,
         )
 
@@ -252,8 +283,13 @@ def logs(
 
             if follow:
                 console.print("\n[yellow]Following logs... (Ctrl+C to stop)[/yellow]")
-                # Note: Real implementation would use WebSocket
-                console.print("[dim]WebSocket follow not implemented in CLI[/dim]")
+                try:
+                    asyncio.run(_follow_logs(feat_id))
+                except KeyboardInterrupt:
+                    console.print("\n[dim]Stopped following logs[/dim]")
+                except (websockets.exceptions.WebSocketException, OSError) as e:
+                    console.print(f"[red]WebSocket error: {e}[/red]")
+                    raise typer.Exit(1)
         else:
             console.print(f"[red]Feature not found: {feat_id}[/red]")
             raise typer.Exit(1)
@@ -271,8 +307,8 @@ def approve(
 ):
     """Approve a workflow phase."""
     try:
-        response = httpx.post(
-            get_api_url("/api/specs/approve"),
+        response = _client.post(
+            "/api/specs/approve",
             json={
                 "feat_id": feat_id,
                 "phase": phase,
@@ -301,8 +337,8 @@ def reject(
 ):
     """Reject a workflow phase."""
     try:
-        response = httpx.post(
-            get_api_url("/api/specs/approve"),
+        response = _client.post(
+            "/api/specs/approve",
             json={
                 "feat_id": feat_id,
                 "phase": phase,
@@ -2,12 +2,17 @@
 Database operations for ClaudeForge using SQLite.
 """
 
+import itertools
 import os
+import queue
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
+import feature_cache
 from models import (
     Feature,
     LogEntry,
@@ -19,13 +24,43 @@ from models import (
 
 DATABASE_PATH = os.getenv("DATABASE_PATH", "/app/data/db.sqlite")
 
+# Value -> member maps for the enums decoded on every row read; a dict
+# hit skips the EnumMeta __call__ machinery on the hot read paths.
+_PHASE_STATUS = {member.value: member for member in PhaseStatus}
+_WORKFLOW_PHASE = {member.value: member for member in WorkflowPhase}
+_PROJECT_STATUS = {member.value: member for member in ProjectStatus}
+
+
+def _now_us() -> int:
+    """Current time as an integer microsecond epoch.
+
+    All timestamps are stored this way: 8 bytes per value instead of a
+    ~27-byte ISO string, and reads never parse text.
+    """
+    return int(time.time() * 1_000_000)
+
+# Per-connection tuning. WAL itself persists in the database file header
+# (set once in init_db); everything else resets per connection, so get_db
+# applies these on every connect. NORMAL sync under WAL drops the
+# double-fsync per commit while staying durable across app crashes.
+# Throwaway databases (the test suite) may relax this to OFF via env.
+_SYNCHRONOUS = os.getenv("CF_SQLITE_SYNCHRONOUS", "NORMAL")
+
+_CONNECTION_PRAGMAS = (
+    f"PRAGMA synchronous={_SYNCHRONOUS}",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS projects (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT UNIQUE NOT NULL,
     path TEXT NOT NULL,
     status TEXT DEFAULT 'active',
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    created_at INTEGER
 );
 
 CREATE TABLE IF NOT EXISTS features (
@@ -35,17 +70,16 @@ CREATE TABLE IF NOT EXISTS features (
     description TEXT,
     status TEXT DEFAULT 'draft',
     current_phase TEXT DEFAULT 'requirements',
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    created_at INTEGER,
     FOREIGN KEY (project_id) REFERENCES projects(id)
 );
 
 CREATE TABLE IF NOT EXISTS logs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    feature_id TEXT NOT NULL,
-    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    feature_pk INTEGER NOT NULL REFERENCES features(id),
+    timestamp INTEGER,
     message TEXT,
-    level TEXT DEFAULT 'info',
-    FOREIGN KEY (feature_id) REFERENCES features(feature_id)
+    level TEXT DEFAULT 'info'
 );
 
 CREATE TABLE IF NOT EXISTS feature_counter (
@@ -53,135 +87,338 @@ CREATE TABLE IF NOT EXISTS feature_counter (
     counter INTEGER DEFAULT 0
 );
 
+CREATE TABLE IF NOT EXISTS llm_cache (
+    hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT,
+    created_ts INTEGER,
+    PRIMARY KEY (hash, model)
+);
+
 CREATE INDEX IF NOT EXISTS idx_features_project ON features(project_id);
 CREATE INDEX IF NOT EXISTS idx_features_status ON features(status);
-CREATE INDEX IF NOT EXISTS idx_logs_feature ON logs(feature_id);
-CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp);
+CREATE INDEX IF NOT EXISTS idx_logs_feat_ts
+    ON logs(feature_pk, timestamp DESC, level, message);
 """
 
 
-@contextmanager
-def get_db():
-    """Get database connection with context manager."""
-    os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
-    conn = sqlite3.connect(DATABASE_PATH)
+# SQL used by the write helpers, hoisted so the connections' statement
+# caches key on a stable string identity.
+_SQL_INSERT_PROJECT = (
+    "INSERT INTO projects (name, path, status, created_at) VALUES (?, ?, ?, ?)"
+)
+_SQL_UPSERT_PROJECT = (
+    "INSERT OR IGNORE INTO projects (name, path, status, created_at) VALUES (?, ?, ?, ?)"
+)
+_SQL_INSERT_FEATURE = """INSERT INTO features
+       (feature_id, project_id, description, status, current_phase, created_at)
+       VALUES (?, ?, ?, ?, ?, ?)"""
+_SQL_INSERT_LOG = (
+    "INSERT INTO logs (feature_pk, timestamp, message, level) VALUES (?, ?, ?, ?)"
+)
+_SQL_BUMP_COUNTER = """INSERT INTO feature_counter (date, counter) VALUES (?, 1)
+       ON CONFLICT(date) DO UPDATE SET counter = counter + 1
+       RETURNING counter"""
+
+
+# Connection pool: opening a fresh connection per call re-parses PRAGMAs
+# and rewarms the page cache on every request. We keep one dedicated
+# writer connection (WAL allows exactly one writer at a time anyway) and a
+# small pool of reader connections handed out to FastAPI's worker threads.
+# The pool is rebuilt lazily whenever DATABASE_PATH changes (the tests
+# repoint it at a temp file per test).
+_POOL_SIZE = min(os.cpu_count() or 4, 8)
+_pool: queue.Queue = queue.Queue()
+_writer: Optional[sqlite3.Connection] = None
+_writer_lock = threading.Lock()
+_pool_path: Optional[str] = None
+_pool_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    # URI paths (file:...?mode=memory&cache=shared in the tests) have no
+    # directory to create
+    is_uri = DATABASE_PATH.startswith("file:")
+    if not is_uri:
+        os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
+    # cached_statements keeps our small fixed query set parsed/planned on
+    # the long-lived pooled connections (the SQL constants above give the
+    # cache stable keys)
+    conn = sqlite3.connect(
+        DATABASE_PATH, check_same_thread=False, cached_statements=128, uri=is_uri
+    )
     conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-    finally:
-        conn.close()
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _ensure_pool() -> None:
+    """(Re)build the pool if it has never been filled or the path changed."""
+    global _writer, _pool_path
+    if _pool_path == DATABASE_PATH:
+        return
+    with _pool_lock:
+        if _pool_path == DATABASE_PATH:
+            return
+        while True:
+            try:
+                _pool.get_nowait().close()
+            except queue.Empty:
+                break
+        if _writer is not None:
+            _writer.close()
+        for _ in range(_POOL_SIZE):
+            _pool.put(_connect())
+        _writer = _connect()
+        _pool_path = DATABASE_PATH
+        # Buffered rows and memoized lookups belong to the previous database
+        with _log_buffer_lock:
+            _log_buffer.clear()
+        _clear_project_caches()
+        _feature_pk_cache.clear()
+        feature_cache.clear()
+
+
+@contextmanager
+def get_db(write: bool = False):
+    """Borrow a pooled database connection.
+
+    Readers check a connection out of the pool; writers share the single
+    writer connection under a lock, matching WAL's one-writer model.
+    """
+    _ensure_pool()
+    if write:
+        with _writer_lock:
+            yield _writer
+    else:
+        conn = _pool.get()
+        try:
+            yield conn
+        finally:
+            _pool.put(conn)
+
+
+def _migrate_legacy_schema(conn: sqlite3.Connection) -> None:
+    """Bring a pre-integer-timestamp database up to the current schema.
+
+    Databases created before the feature_pk switch key logs on
+    feature_id TEXT with DATETIME strings throughout; the current
+    indexes cannot even be created against that table, so it is rebuilt
+    with feature_id mapped to the feature's integer primary key. Stored
+    DATETIME/ISO strings in every table are converted to the integer
+    microsecond epochs the read paths expect. No-ops on current
+    databases.
+    """
+    log_cols = {row[1] for row in conn.execute("PRAGMA table_info(logs)")}
+    if log_cols and "feature_pk" not in log_cols:
+        conn.executescript(
+            """
+            CREATE TABLE logs_migrated (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                feature_pk INTEGER NOT NULL REFERENCES features(id),
+                timestamp INTEGER,
+                message TEXT,
+                level TEXT DEFAULT 'info'
+            );
+            INSERT INTO logs_migrated (id, feature_pk, timestamp, message, level)
+                SELECT l.id, f.id,
+                       CAST(strftime('%s', l.timestamp) AS INTEGER) * 1000000,
+                       l.message, l.level
+                FROM logs l JOIN features f ON f.feature_id = l.feature_id;
+            DROP TABLE logs;
+            ALTER TABLE logs_migrated RENAME TO logs;
+            DROP INDEX IF EXISTS idx_logs_feature;
+            """
+        )
+
+    for table in ("features", "projects"):
+        if conn.execute(f"PRAGMA table_info({table})").fetchone():
+            conn.execute(
+                f"""UPDATE {table}
+                    SET created_at = CAST(strftime('%s', created_at) AS INTEGER) * 1000000
+                    WHERE typeof(created_at) = 'text'"""
+            )
 
 
 def init_db() -> None:
     """Initialize the database schema."""
-    with get_db() as conn:
+    with get_db(write=True) as conn:
+        # WAL lets readers proceed during writes and halves fsync traffic;
+        # the mode is sticky, so setting it here covers every later connection.
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Rebuild legacy tables first: SCHEMA's indexes reference columns
+        # that pre-feature_pk databases don't have
+        _migrate_legacy_schema(conn)
         conn.executescript(SCHEMA)
+        # Migration: the global timestamp index was never used (all log
+        # queries filter by feature first) and cost a second B-tree
+        # insert per log row
+        conn.execute("DROP INDEX IF EXISTS idx_logs_timestamp")
+        # Migration: the NOCASE feature_id index never matched a query --
+        # equality lookups seek the BINARY-collated UNIQUE autoindex and
+        # the leading-% search LIKE can't seek at all
+        conn.execute("DROP INDEX IF EXISTS idx_features_feature_id")
         conn.commit()
 
 
-def register_project(name: str, path: str) -> Project:
-    """Register a project, returning existing if already registered."""
+def optimize_db() -> None:
+    """Run SQLite's query-planner maintenance; cheap, called at startup."""
     with get_db() as conn:
-        cursor = conn.cursor()
+        conn.execute("PRAGMA optimize")
+
 
+def register_project(name: str, path: str) -> Project:
+    """Register a project, returning existing if already registered."""
+    with get_db(write=True) as conn:
         # Check if exists
-        cursor.execute("SELECT * FROM projects WHERE name = ?", (name,))
-        row = cursor.fetchone()
+        row = conn.execute(
+            "SELECT * FROM projects WHERE name = ?", (name,)
+        ).fetchone()
 
         if row:
-            return Project(
-                id=row["id"],
-                name=row["name"],
-                path=row["path"],
-                status=ProjectStatus(row["status"]),
-            )
+            return Project.from_row(row)
 
-        # Insert new
-        cursor.execute(
-            "INSERT INTO projects (name, path, status) VALUES (?, ?, ?)",
-            (name, path, ProjectStatus.ACTIVE.value),
-        )
-        conn.commit()
+        # Insert new; the with-block commits on success, rolls back on error
+        with conn:
+            cursor = conn.execute(
+                _SQL_INSERT_PROJECT,
+                (name, path, ProjectStatus.ACTIVE.value, _now_us()),
+            )
 
-        return Project(
+        project = Project(
             id=cursor.lastrowid,
             name=name,
             path=path,
             status=ProjectStatus.ACTIVE,
         )
+        _cache_project(project)
+        return project
+
+
+def register_projects_bulk(items: list[tuple[str, str]]) -> None:
+    """Register many projects in one transaction, skipping existing rows.
+
+    Replaces per-name register_project loops: one INSERT OR IGNORE batch
+    means one commit instead of a SELECT-maybe-INSERT-commit per project.
+    """
+    if not items:
+        return
+
+    now = _now_us()
+    rows = [(name, path, ProjectStatus.ACTIVE.value, now) for name, path in items]
+    with get_db(write=True) as conn:
+        with conn:
+            conn.executemany(_SQL_UPSERT_PROJECT, rows)
+
+
+# Project lookup caches. Plain dicts (instead of lru_cache) so a single
+# prefetch JOIN can seed both name and id lookups at startup; misses are
+# not cached.
+_project_by_name: dict[str, Project] = {}
+_project_by_id: dict[int, Project] = {}
+
+
+def _cache_project(project: Project) -> None:
+    _project_by_name[project.name] = project
+    _project_by_id[project.id] = project
+
+
+def _clear_project_caches() -> None:
+    _project_by_name.clear()
+    _project_by_id.clear()
 
 
 def get_project(name: str) -> Optional[Project]:
-    """Get a project by name."""
+    """Get a project by name; projects change rarely, so results are memoized."""
+    project = _project_by_name.get(name)
+    if project is not None:
+        return project
+
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM projects WHERE name = ?", (name,))
-        row = cursor.fetchone()
+        row = conn.execute(
+            "SELECT * FROM projects WHERE name = ?", (name,)
+        ).fetchone()
 
-        if not row:
-            return None
+    if not row:
+        return None
 
-        return Project(
-            id=row["id"],
-            name=row["name"],
-            path=row["path"],
-            status=ProjectStatus(row["status"]),
-        )
+    project = Project.from_row(row)
+    _cache_project(project)
+    return project
 
 
 def get_project_by_id(project_id: int) -> Optional[Project]:
-    """Get a project by ID."""
+    """Get a project by ID; projects change rarely, so results are memoized."""
+    project = _project_by_id.get(project_id)
+    if project is not None:
+        return project
+
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
-        row = cursor.fetchone()
+        row = conn.execute(
+            "SELECT * FROM projects WHERE id = ?", (project_id,)
+        ).fetchone()
 
-        if not row:
-            return None
+    if not row:
+        return None
 
-        return Project(
-            id=row["id"],
-            name=row["name"],
-            path=row["path"],
-            status=ProjectStatus(row["status"]),
-        )
+    project = Project.from_row(row)
+    _cache_project(project)
+    return project
+
+
+def get_projects_with_feature_counts() -> list[tuple[Project, int]]:
+    """Load every project plus its feature count in one JOIN.
+
+    Called once at startup: seeds both project lookup caches so the
+    /api/projects/* endpoints hit memory instead of SQLite.
+    """
+    with get_db() as conn:
+        rows = conn.execute(
+            """SELECT p.id, p.name, p.path, p.status, COUNT(f.id) AS feature_count
+               FROM projects p
+               LEFT JOIN features f ON f.project_id = p.id
+               GROUP BY p.id"""
+        ).fetchall()
+
+    results = []
+    for row in rows:
+        project = Project.from_row(row)
+        _cache_project(project)
+        results.append((project, row["feature_count"]))
+    return results
 
 
 def list_projects() -> list[Project]:
     """List all projects."""
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM projects ORDER BY name")
-        rows = cursor.fetchall()
-
+        cursor = conn.execute("SELECT id, name, path, status FROM projects ORDER BY name")
+        # Positional tuples: sqlite3.Row does a name scan per column access
+        cursor.row_factory = None
+        # Trusted rows: model_construct skips validation per project
         return [
-            Project(
-                id=row["id"],
-                name=row["name"],
-                path=row["path"],
-                status=ProjectStatus(row["status"]),
+            Project.model_construct(
+                id=id_, name=name, path=path, status=_PROJECT_STATUS[status]
             )
-            for row in rows
+            for id_, name, path, status in cursor.fetchall()
         ]
 
 
 def create_feature(feature_id: str, project_id: int, description: str) -> Feature:
     """Create a new feature record."""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """INSERT INTO features
-               (feature_id, project_id, description, status, current_phase)
-               VALUES (?, ?, ?, ?, ?)""",
-            (
-                feature_id,
-                project_id,
-                description,
-                PhaseStatus.DRAFT.value,
-                WorkflowPhase.REQUIREMENTS.value,
-            ),
-        )
-        conn.commit()
+    with get_db(write=True) as conn:
+        with conn:
+            cursor = conn.execute(
+                _SQL_INSERT_FEATURE,
+                (
+                    feature_id,
+                    project_id,
+                    description,
+                    PhaseStatus.DRAFT.value,
+                    WorkflowPhase.REQUIREMENTS.value,
+                    _now_us(),
+                ),
+            )
 
         return Feature(
             id=cursor.lastrowid,
@@ -193,6 +430,101 @@ def create_feature(feature_id: str, project_id: int, description: str) -> Featur
         )
 
 
+def list_features_by_project_raw(project_id: int) -> list[dict]:
+    """Feature rows as plain dicts for the API hot path.
+
+    Skips Pydantic validation and enum coercion: FastAPI serializes the
+    dicts directly and the JSON output is identical to the model path,
+    including created_at decoded back to an ISO timestamp.
+    """
+    with get_db() as conn:
+        rows = conn.execute(
+            """SELECT id, feature_id, project_id, description, status,
+                      current_phase, created_at
+               FROM features WHERE project_id = ? ORDER BY created_at DESC""",
+            (project_id,),
+        ).fetchall()
+
+    results = []
+    for row in rows:
+        item = dict(row)
+        ts = item["created_at"]
+        if ts is not None:
+            item["created_at"] = datetime.utcfromtimestamp(ts / 1_000_000).isoformat()
+        results.append(item)
+    return results
+
+
+def create_workflow_atomic(
+    project_name: str, path: str, description: str
+) -> tuple[Project, Feature]:
+    """Create everything a new workflow needs in one transaction.
+
+    Registers the project if missing, bumps the daily feature counter,
+    inserts the feature row, and records the initial log line under a
+    single commit -- one fsync where /api/agents/start used to pay four.
+    """
+    today = datetime.utcnow().strftime("%Y%m%d")
+    now = datetime.utcnow()
+
+    with get_db(write=True) as conn:
+        with conn:
+            conn.execute(
+                _SQL_UPSERT_PROJECT,
+                (project_name, path, ProjectStatus.ACTIVE.value, _now_us()),
+            )
+            project_row = conn.execute(
+                "SELECT * FROM projects WHERE name = ?", (project_name,)
+            ).fetchone()
+
+            counter = conn.execute(_SQL_BUMP_COUNTER, (today,)).fetchone()[0]
+            feature_id = f"FEAT-{today}-{counter:03d}"
+
+            cursor = conn.execute(
+                _SQL_INSERT_FEATURE,
+                (
+                    feature_id,
+                    project_row["id"],
+                    description,
+                    PhaseStatus.DRAFT.value,
+                    WorkflowPhase.REQUIREMENTS.value,
+                    _now_us(),
+                ),
+            )
+            feature_row_id = cursor.lastrowid
+
+            conn.execute(
+                _SQL_INSERT_LOG,
+                (
+                    feature_row_id,
+                    _to_micros(now),
+                    f"Workflow created for project {project_name}",
+                    "info",
+                ),
+            )
+
+    _feature_pk_cache[feature_id] = feature_row_id
+    # Seed the status cache so the first polls skip SQLite entirely
+    feature_cache.put(
+        feature_id,
+        PhaseStatus.DRAFT,
+        WorkflowPhase.REQUIREMENTS,
+        project_row["id"],
+    )
+
+    project = Project.from_row(project_row)
+    _cache_project(project)
+    feature = Feature(
+        id=feature_row_id,
+        feature_id=feature_id,
+        project_id=project_row["id"],
+        description=description,
+        status=PhaseStatus.DRAFT,
+        current_phase=WorkflowPhase.REQUIREMENTS,
+    )
+    return project, feature
+
+
 def get_feature(feature_id: str) -> Optional[Feature]:
     """Get a feature by feature_id."""
     with get_db() as conn:
@@ -203,131 +535,323 @@ def get_feature(feature_id: str) -> Optional[Feature]:
         if not row:
             return None
 
-        return Feature(
-            id=row["id"],
-            feature_id=row["feature_id"],
-            project_id=row["project_id"],
-            description=row["description"],
-            status=PhaseStatus(row["status"]),
-            current_phase=WorkflowPhase(row["current_phase"]),
-        )
+        # Trusted row: skip pydantic validation entirely
+        return Feature.from_row(row)
 
 
 def update_feature_status(
     feature_id: str, status: PhaseStatus, phase: Optional[WorkflowPhase] = None
 ) -> bool:
     """Update feature status and optionally the current phase."""
-    with get_db() as conn:
-        cursor = conn.cursor()
-
-        if phase:
-            cursor.execute(
-                "UPDATE features SET status = ?, current_phase = ? WHERE feature_id = ?",
-                (status.value, phase.value, feature_id),
-            )
+    with get_db(write=True) as conn:
+        with conn:
+            # RETURNING hands back the project_id the status cache needs
+            # without a second lookup
+            if phase:
+                row = conn.execute(
+                    """UPDATE features SET status = ?, current_phase = ?
+                       WHERE feature_id = ? RETURNING project_id""",
+                    (status.value, phase.value, feature_id),
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "UPDATE features SET status = ? WHERE feature_id = ? RETURNING project_id",
+                    (status.value, feature_id),
+                ).fetchone()
+
+        # Keep the in-process status cache in sync with the write
+        if row and phase:
+            feature_cache.put(feature_id, status, phase, row[0])
         else:
-            cursor.execute(
-                "UPDATE features SET status = ? WHERE feature_id = ?",
-                (status.value, feature_id),
-            )
+            feature_cache.invalidate(feature_id)
 
-        conn.commit()
-        return cursor.rowcount > 0
+        return row is not None
 
 
 def list_features_by_project(project_id: int) -> list[Feature]:
     """List all features for a project."""
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM features WHERE project_id = ? ORDER BY created_at DESC",
+        cursor = conn.execute(
+            """SELECT id, feature_id, project_id, description, status, current_phase
+               FROM features WHERE project_id = ? ORDER BY created_at DESC""",
             (project_id,),
         )
-        rows = cursor.fetchall()
-
+        cursor.row_factory = None
+        # Trusted rows: model_construct skips validation per feature
         return [
-            Feature(
-                id=row["id"],
-                feature_id=row["feature_id"],
-                project_id=row["project_id"],
-                description=row["description"],
-                status=PhaseStatus(row["status"]),
-                current_phase=WorkflowPhase(row["current_phase"]),
+            Feature.model_construct(
+                id=id_,
+                feature_id=feature_id,
+                project_id=proj_id,
+                description=description,
+                status=_PHASE_STATUS[status],
+                current_phase=_WORKFLOW_PHASE[current_phase],
             )
-            for row in rows
+            for id_, feature_id, proj_id, description, status, current_phase
+            in cursor.fetchall()
         ]
 
 
-def add_log(feature_id: str, message: str, level: str = "info") -> LogEntry:
-    """Add a log entry for a feature."""
+# Log write coalescing: workflows emit many log lines and a commit per
+# line is the dominant cost. add_log buffers rows and a short debounce
+# timer (or a full buffer) flushes them in one transaction. get_logs
+# flushes first so reads always see their own writes.
+LOG_FLUSH_INTERVAL = 0.1
+LOG_FLUSH_BATCH = 500
+
+_log_buffer: list[tuple[str, datetime, str, str]] = []
+_log_buffer_lock = threading.Lock()
+_log_flush_timer: Optional[threading.Timer] = None
+_log_ids = itertools.count(1)
+
+
+def flush_logs() -> None:
+    """Write all buffered log rows in a single transaction."""
+    global _log_flush_timer
+    with _log_buffer_lock:
+        rows = _log_buffer[:]
+        _log_buffer.clear()
+        if _log_flush_timer is not None:
+            _log_flush_timer.cancel()
+            _log_flush_timer = None
+    add_log_batch(rows)
+
+
+def search_features(
+    query: str,
+    project_name: Optional[str] = None,
+    status: Optional[str] = None,
+    phase: Optional[str] = None,
+) -> list[dict]:
+    """Search features with one indexed query.
+
+    Replaces the /api/search loop that walked every project's spec
+    directories and ran a SELECT per feature ID; all filtering happens in
+    SQL with bound parameters.
+    """
+    sql = [
+        """SELECT f.feature_id, p.name AS project, f.status, f.current_phase
+           FROM features f
+           JOIN projects p ON p.id = f.project_id
+           WHERE f.feature_id LIKE ?"""
+    ]
+    params: list = [f"%{query}%"]
+
+    if project_name:
+        sql.append("AND p.name = ?")
+        params.append(project_name)
+    if status:
+        sql.append("AND f.status = ?")
+        params.append(status)
+    if phase:
+        sql.append("AND f.current_phase = ?")
+        params.append(phase)
+    sql.append("ORDER BY f.feature_id DESC")
+
     with get_db() as conn:
-        cursor = conn.cursor()
-        timestamp = datetime.utcnow()
-        cursor.execute(
-            "INSERT INTO logs (feature_id, timestamp, message, level) VALUES (?, ?, ?, ?)",
-            (feature_id, timestamp, message, level),
-        )
-        conn.commit()
+        rows = conn.execute(" ".join(sql), params).fetchall()
+
+    return [
+        {
+            "project": row["project"],
+            "feature_id": row["feature_id"],
+            "status": row["status"],
+            "phase": row["current_phase"],
+        }
+        for row in rows
+    ]
 
-        return LogEntry(
-            id=cursor.lastrowid,
-            feature_id=feature_id,
-            timestamp=timestamp,
-            message=message,
-            level=level,
-        )
+
+def add_log(feature_id: str, message: str, level: str = "info") -> LogEntry:
+    """Buffer a log entry for a feature; rows are flushed in batches."""
+    global _log_flush_timer
+    timestamp = datetime.utcnow()
+    with _log_buffer_lock:
+        _log_buffer.append((feature_id, timestamp, message, level))
+        pending = len(_log_buffer)
+        if pending < LOG_FLUSH_BATCH and _log_flush_timer is None:
+            _log_flush_timer = threading.Timer(LOG_FLUSH_INTERVAL, flush_logs)
+            _log_flush_timer.daemon = True
+            _log_flush_timer.start()
+    if pending >= LOG_FLUSH_BATCH:
+        flush_logs()
+
+    # The id is synthetic: the row hasn't hit the database yet
+    return LogEntry(
+        id=next(_log_ids),
+        feature_id=feature_id,
+        timestamp=timestamp,
+        message=message,
+        level=level,
+    )
+
+
+# Logs reference features by their integer primary key: smaller index
+# entries and integer comparisons instead of string compares on every
+# insert and lookup. The feature_id string -> pk mapping is immutable
+# once a feature exists, so it is cached in-process (misses are not
+# cached; a feature may be created after the first lookup).
+_feature_pk_cache: dict[str, int] = {}
+
+
+def _feature_pk(feature_id: str) -> Optional[int]:
+    pk = _feature_pk_cache.get(feature_id)
+    if pk is None:
+        with get_db() as conn:
+            row = conn.execute(
+                "SELECT id FROM features WHERE feature_id = ?", (feature_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        pk = row["id"]
+        _feature_pk_cache[feature_id] = pk
+    return pk
+
+
+# Log timestamps are stored as integer microsecond epochs: inserting an
+# int is cheaper than serializing a datetime, and reads skip
+# datetime.fromisoformat parsing per row.
+def _to_micros(ts: datetime) -> int:
+    return int(ts.replace(tzinfo=timezone.utc).timestamp() * 1_000_000)
+
+
+# Above this row count, a single multi-row INSERT beats executemany's
+# per-row statement steps. SQLite caps bound parameters at 32766
+# (SQLITE_MAX_VARIABLE_NUMBER); 4 params per row keeps chunks well under.
+_LOG_MULTIROW_THRESHOLD = 100
+_LOG_MULTIROW_CHUNK = 500
+
+
+def add_log_batch(rows: list[tuple[str, datetime, str, str]]) -> None:
+    """Insert multiple log entries in a single transaction.
+
+    Each row is a (feature_id, timestamp, message, level) tuple. Small
+    batches go through executemany; large ones are folded into multi-row
+    INSERT ... VALUES statements so SQLite steps one statement per chunk
+    instead of one per row.
+    """
+    if not rows:
+        return
+
+    encoded = []
+    for feature_id, ts, message, level in rows:
+        pk = _feature_pk(feature_id)
+        if pk is None:
+            continue
+        encoded.append((pk, _to_micros(ts), message, level))
+    if not encoded:
+        return
+
+    with get_db(write=True) as conn:
+        with conn:
+            if len(encoded) < _LOG_MULTIROW_THRESHOLD:
+                conn.executemany(_SQL_INSERT_LOG, encoded)
+                return
+            for start in range(0, len(encoded), _LOG_MULTIROW_CHUNK):
+                chunk = encoded[start : start + _LOG_MULTIROW_CHUNK]
+                sql = (
+                    "INSERT INTO logs (feature_pk, timestamp, message, level) VALUES "
+                    + ",".join(("(?, ?, ?, ?)",) * len(chunk))
+                )
+                conn.execute(sql, [v for row in chunk for v in row])
 
 
 def get_logs(feature_id: str, limit: int = 100) -> list[LogEntry]:
     """Get logs for a feature."""
+    flush_logs()
+    pk = _feature_pk(feature_id)
+    if pk is None:
+        return []
+
     with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """SELECT * FROM logs
-               WHERE feature_id = ?
+        cursor = conn.execute(
+            """SELECT id, timestamp, message, level FROM logs
+               WHERE feature_pk = ?
                ORDER BY timestamp DESC
                LIMIT ?""",
-            (feature_id, limit),
+            (pk, limit),
         )
-        rows = cursor.fetchall()
-
+        cursor.row_factory = None
+        # Trusted rows: model_construct skips validation per log line
         return [
-            LogEntry(
-                id=row["id"],
-                feature_id=row["feature_id"],
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-                message=row["message"],
-                level=row["level"],
+            LogEntry.model_construct(
+                id=id_,
+                feature_id=feature_id,
+                timestamp=datetime.utcfromtimestamp(ts / 1_000_000),
+                message=message,
+                level=level,
             )
-            for row in rows
+            for id_, ts, message, level in cursor.fetchall()
         ]
 
 
-def get_next_feature_number() -> int:
-    """Get the next feature number for today's date."""
-    today = datetime.utcnow().strftime("%Y%m%d")
+def get_log_messages(feature_id: str, limit: int = 50) -> list[str]:
+    """Get recent log messages only, newest first.
+
+    Hot path for the status endpoint: no LogEntry construction and no
+    timestamp decoding, just the message column off the index.
+    """
+    flush_logs()
+    pk = _feature_pk(feature_id)
+    if pk is None:
+        return []
 
     with get_db() as conn:
         cursor = conn.cursor()
-
-        # Get current counter for today
         cursor.execute(
-            "SELECT counter FROM feature_counter WHERE date = ?", (today,)
+            """SELECT message FROM logs
+               WHERE feature_pk = ?
+               ORDER BY timestamp DESC
+               LIMIT ?""",
+            (pk, limit),
         )
-        row = cursor.fetchone()
+        return [row["message"] for row in cursor.fetchall()]
 
-        if row:
-            next_num = row["counter"] + 1
-            cursor.execute(
-                "UPDATE feature_counter SET counter = ? WHERE date = ?",
-                (next_num, today),
+
+# Bounds for the content-addressed LLM response cache
+LLM_CACHE_MAX_ENTRIES = 10_000
+LLM_CACHE_TTL_DAYS = 7
+
+
+def get_cached_llm_response(prompt_hash: str, model: str) -> Optional[str]:
+    """Look up a cached LLM response, ignoring entries past the TTL."""
+    cutoff = _now_us() - LLM_CACHE_TTL_DAYS * 86_400 * 1_000_000
+    with get_db() as conn:
+        row = conn.execute(
+            """SELECT response FROM llm_cache
+               WHERE hash = ? AND model = ? AND created_ts >= ?""",
+            (prompt_hash, model, cutoff),
+        ).fetchone()
+        return row["response"] if row else None
+
+
+def put_cached_llm_response(prompt_hash: str, model: str, response: str) -> None:
+    """Store an LLM response, evicting the oldest entries past the size bound."""
+    with get_db(write=True) as conn:
+        with conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO llm_cache (hash, model, response, created_ts)
+                   VALUES (?, ?, ?, ?)""",
+                (prompt_hash, model, response, _now_us()),
             )
-        else:
-            next_num = 1
-            cursor.execute(
-                "INSERT INTO feature_counter (date, counter) VALUES (?, ?)",
-                (today, next_num),
+            conn.execute(
+                """DELETE FROM llm_cache WHERE rowid NOT IN (
+                       SELECT rowid FROM llm_cache
+                       ORDER BY created_ts DESC LIMIT ?
+                   )""",
+                (LLM_CACHE_MAX_ENTRIES,),
             )
 
-        conn.commit()
-        return next_num
+
+def get_next_feature_number() -> int:
+    """Get the next feature number for today's date.
+
+    Single atomic UPSERT instead of SELECT-then-UPDATE/INSERT: one
+    statement, one commit, and no race when two workflows start at once.
+    Requires SQLite >= 3.35 for RETURNING (shipped in the base image).
+    """
+    today = datetime.utcnow().strftime("%Y%m%d")
+
+    with get_db(write=True) as conn:
+        with conn:
+            return conn.execute(_SQL_BUMP_COUNTER, (today,)).fetchone()[0]
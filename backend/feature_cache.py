@@ -0,0 +1,53 @@
+"""
+In-memory cache of feature status for hot status-poll paths.
+Updated on every in-process status transition; entries expire after a
+short TTL so changes made by other processes are still picked up.
+"""
+
+import time
+from typing import Optional
+
+from cachetools import LRUCache
+
+from models import PhaseStatus, WorkflowPhase
+
+# Entries older than this fall back to the database
+CACHE_TTL_SECONDS = 5.0
+
+_cache: LRUCache = LRUCache(maxsize=1024)
+
+
+def put(
+    feat_id: str,
+    status: PhaseStatus,
+    phase: Optional[WorkflowPhase],
+    project_id: int,
+) -> None:
+    """Record the latest known (status, phase, project_id) for a feature."""
+    _cache[feat_id] = (status, phase, project_id, time.monotonic())
+
+
+def get(
+    feat_id: str,
+) -> Optional[tuple[PhaseStatus, Optional[WorkflowPhase], int]]:
+    """Get a fresh cached (status, phase, project_id), or None on miss or stale entry."""
+    entry = _cache.get(feat_id)
+    if entry is None:
+        return None
+
+    status, phase, project_id, cached_at = entry
+    if time.monotonic() - cached_at > CACHE_TTL_SECONDS:
+        _cache.pop(feat_id, None)
+        return None
+
+    return status, phase, project_id
+
+
+def invalidate(feat_id: str) -> None:
+    """Drop a feature's cached status."""
+    _cache.pop(feat_id, None)
+
+
+def clear() -> None:
+    """Drop every cached status (the database was repointed)."""
+    _cache.clear()
@@ -0,0 +1,75 @@
+"""
+Debounced write-batcher for agent log entries.
+Coalesces per-line SQLite inserts into batched transactions.
+"""
+
+import atexit
+import threading
+from datetime import datetime
+from typing import Optional
+
+from db import add_log_batch
+
+
+class LogBatcher:
+    """Coalesce log inserts into single batched SQLite transactions.
+
+    Rows accumulate until either the flush interval elapses without a new
+    row or max_batch rows are pending, then one executemany transaction
+    writes them all. Error-level rows force an immediate synchronous flush
+    so failures stay visible even if the process dies right after.
+    """
+
+    def __init__(self, flush_interval: float = 0.05, max_batch: int = 200):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._rows: list[tuple[str, datetime, str, str]] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def add(
+        self,
+        feat_id: str,
+        message: str,
+        level: str = "info",
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """Queue a log row, flushing immediately for errors or full batches."""
+        row = (feat_id, timestamp or datetime.utcnow(), message, level)
+        with self._lock:
+            self._rows.append(row)
+            force = level == "error" or len(self._rows) >= self.max_batch
+            if not force:
+                self._reschedule_locked()
+
+        if force:
+            self.flush()
+
+    def _reschedule_locked(self) -> None:
+        """Restart the idle-flush timer. Caller must hold the lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.flush_interval, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> None:
+        """Write all pending rows in one transaction."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            rows, self._rows = self._rows, []
+
+        add_log_batch(rows)
+
+    @property
+    def pending(self) -> int:
+        """Number of rows waiting to be flushed."""
+        with self._lock:
+            return len(self._rows)
+
+
+# Shared batcher instance; flushed at exit so shutdown doesn't lose logs
+batcher = LogBatcher()
+atexit.register(batcher.flush)
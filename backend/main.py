@@ -9,27 +9,39 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Optional
 
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
-from agents import get_log_queue, workflow_manager
+from agents import (
+    get_log_queue,
+    shutdown_workflows,
+    start_log_listener,
+    stop_log_listener,
+    warm_agents,
+    workflow_manager,
+)
 from db import (
     add_log,
-    create_feature,
+    create_workflow_atomic,
+    flush_logs,
     get_feature,
-    get_logs,
+    get_log_messages,
     get_project,
     get_project_by_id,
+    get_projects_with_feature_counts,
     init_db,
-    list_features_by_project,
+    list_features_by_project_raw,
+    optimize_db,
     list_projects,
     register_project,
+    register_projects_bulk,
+    search_features,
 )
 from models import (
     AgentStatusResponse,
     ApproveSpecRequest,
     ApproveSpecResponse,
-    Feature,
     HealthResponse,
     PhaseStatus,
     Project,
@@ -40,11 +52,12 @@ from models import (
     WebSocketMessage,
     WorkflowPhase,
 )
+import feature_cache
+import utils
 from utils import (
     calculate_progress,
-    generate_feat_id,
-    get_all_phase_specs,
     get_project_features,
+    read_all_phase_specs,
     scan_projects,
     update_phase_status,
     validate_feature_id,
@@ -55,10 +68,36 @@ from utils import (
 async def lifespan(app: FastAPI):
     """Initialize database on startup."""
     init_db()
-    # Auto-register projects from /projects directory
-    for project_name in scan_projects():
-        register_project(project_name, f"/projects/{project_name}")
+    optimize_db()
+    # Auto-register projects from /projects directory in one transaction,
+    # then warm the project lookup caches with a single JOIN
+    register_projects_bulk(
+        [(name, f"/projects/{name}") for name in scan_projects()]
+    )
+    get_projects_with_feature_counts()
+    # Populate agent caches so the first workflow doesn't pay construction cost
+    warm_agents()
+    # Drain agent logs to DB/WebSockets on a background thread
+    start_log_listener()
     yield
+    shutdown_workflows()
+    stop_log_listener()
+    flush_logs()
+
+
+# Project discovery is throttled: the /projects walk plus per-name
+# registration runs at most once per TTL for a given projects root.
+_scan_cache: TTLCache = TTLCache(maxsize=8, ttl=30)
+
+
+def _sync_projects() -> None:
+    """Register any newly appeared projects, rescanning at most every 30s."""
+    if utils.PROJECTS_PATH in _scan_cache:
+        return
+    register_projects_bulk(
+        [(name, f"/projects/{name}") for name in scan_projects()]
+    )
+    _scan_cache[utils.PROJECTS_PATH] = True
 
 
 app = FastAPI(
@@ -83,8 +122,8 @@ app.add_middleware(
 async def health_check():
     """Check API and database health."""
     try:
-        # Quick DB check
-        projects = list_projects()
+        # Quick DB check; off the loop like every other blocking call
+        await asyncio.to_thread(list_projects)
         return HealthResponse(
             status="ok",
             version="0.1.0",
@@ -102,18 +141,18 @@ async def health_check():
 @app.get("/api/projects/list", response_model=ProjectListResponse, tags=["Projects"])
 async def get_projects():
     """List all registered projects."""
-    # Re-scan to pick up new projects
-    for project_name in scan_projects():
-        register_project(project_name, f"/projects/{project_name}")
+    # Re-scan to pick up new projects (throttled); both the scan and the
+    # listing block on I/O, so they run off the event loop
+    await asyncio.to_thread(_sync_projects)
 
-    projects = list_projects()
+    projects = await asyncio.to_thread(list_projects)
     return ProjectListResponse(projects=projects)
 
 
 @app.post("/api/projects/register", response_model=Project, tags=["Projects"])
 async def register_new_project(name: str, path: str):
     """Register a new project."""
-    project = register_project(name, path)
+    project = await asyncio.to_thread(register_project, name, path)
     return project
 
 
@@ -133,20 +172,24 @@ async def get_project_feature_list(project_name: str):
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Get features from both database and filesystem
-    feature_ids = get_project_features(project_name)
-    db_features = list_features_by_project(project.id)
+    # Get features from both database and filesystem; plain dicts skip
+    # Pydantic construction for rows FastAPI would just re-serialize
+    feature_ids = await asyncio.to_thread(get_project_features, project_name)
+    db_features = await asyncio.to_thread(list_features_by_project_raw, project.id)
 
     # Merge and deduplicate
-    all_features = {f.feature_id: f for f in db_features}
+    all_features = {row["feature_id"]: row for row in db_features}
     for fid in feature_ids:
         if fid not in all_features:
-            all_features[fid] = Feature(
-                feature_id=fid,
-                project_id=project.id,
-                description="(from filesystem)",
-                status=PhaseStatus.DRAFT,
-            )
+            all_features[fid] = {
+                "id": None,
+                "feature_id": fid,
+                "project_id": project.id,
+                "description": "(from filesystem)",
+                "status": PhaseStatus.DRAFT.value,
+                "current_phase": WorkflowPhase.REQUIREMENTS.value,
+                "created_at": None,
+            }
 
     return {"features": list(all_features.values())}
 
@@ -162,10 +205,11 @@ async def get_spec(project_name: str, feat_id: str):
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    feature = get_feature(feat_id)
+    feature = await asyncio.to_thread(get_feature, feat_id)
     description = feature.description if feature else ""
 
-    phases = get_all_phase_specs(project_name, feat_id)
+    # Per-phase file reads overlap on the thread pool
+    phases = await read_all_phase_specs(project_name, feat_id)
 
     return SpecResponse(
         feature_id=feat_id,
@@ -178,7 +222,7 @@ async def get_spec(project_name: str, feat_id: str):
 @app.post("/api/specs/approve", response_model=ApproveSpecResponse, tags=["Specs"])
 async def approve_spec(request: ApproveSpecRequest):
     """Approve or reject a spec phase."""
-    feature = get_feature(request.feat_id)
+    feature = await asyncio.to_thread(get_feature, request.feat_id)
     if not feature:
         raise HTTPException(status_code=404, detail="Feature not found")
 
@@ -195,8 +239,9 @@ async def approve_spec(request: ApproveSpecRequest):
     else:
         raise HTTPException(status_code=400, detail="Invalid action")
 
-    # Update phase status
-    spec = update_phase_status(
+    # Update phase status (spec file rewrite: blocking I/O)
+    spec = await asyncio.to_thread(
+        update_phase_status,
         project.name,
         request.feat_id,
         request.phase,
@@ -224,17 +269,15 @@ async def approve_spec(request: ApproveSpecRequest):
 @app.post("/api/agents/start", response_model=StartWorkflowResponse, tags=["Agents"])
 async def start_workflow(request: StartWorkflowRequest):
     """Start a new agent workflow for a feature."""
-    # Validate project exists
-    project = get_project(request.project)
-    if not project:
-        # Try to register it
-        project = register_project(request.project, f"/projects/{request.project}")
-
-    # Generate feature ID
-    feat_id = generate_feat_id()
-
-    # Create feature record
-    create_feature(feat_id, project.id, request.feature_desc)
+    # Register (if needed), allocate the feature ID, and create the
+    # feature plus its first log line in a single transaction
+    project, feature = await asyncio.to_thread(
+        create_workflow_atomic,
+        request.project,
+        f"/projects/{request.project}",
+        request.feature_desc,
+    )
+    feat_id = feature.feature_id
 
     # Start workflow (auto_approve=True for one-shot execution)
     auto_approve = os.getenv("AUTO_APPROVE", "true").lower() == "true"
@@ -258,23 +301,33 @@ async def get_workflow_status(feat_id: str):
     if not validate_feature_id(feat_id):
         raise HTTPException(status_code=400, detail="Invalid feature ID format")
 
-    feature = get_feature(feat_id)
-    if not feature:
-        raise HTTPException(status_code=404, detail="Feature not found")
+    # Fresh in-process status transitions serve the poll without a
+    # SQLite round trip; misses and stale entries fall through to the DB
+    cached = feature_cache.get(feat_id)
+    if cached is not None and cached[1] is not None:
+        status, current_phase, project_id = cached
+    else:
+        feature = await asyncio.to_thread(get_feature, feat_id)
+        if not feature:
+            raise HTTPException(status_code=404, detail="Feature not found")
+        status = feature.status
+        current_phase = feature.current_phase
+        project_id = feature.project_id
+        feature_cache.put(feat_id, status, current_phase, project_id)
 
     # Get project for progress calculation
-    project = get_project_by_id(feature.project_id)
+    project = get_project_by_id(project_id)
     project_name = project.name if project else ""
 
-    # Get recent logs
-    logs = get_logs(feat_id, limit=50)
-    log_messages = [log.message for log in logs]
+    # Logs and progress both block (SQLite flush, spec file reads)
+    log_messages = await asyncio.to_thread(get_log_messages, feat_id, 50)
+    progress = await asyncio.to_thread(calculate_progress, feat_id, project_name)
 
     return AgentStatusResponse(
         feat_id=feat_id,
-        status=feature.status,
-        current_phase=feature.current_phase,
-        progress=calculate_progress(feat_id, project_name),
+        status=status,
+        current_phase=current_phase,
+        progress=progress,
         logs=log_messages,
     )
 
@@ -300,23 +353,24 @@ async def websocket_logs(websocket: WebSocket, feat_id: str):
 
     try:
         while True:
-            # Check for new log messages
             try:
-                # Non-blocking check with timeout
-                await asyncio.sleep(0.1)
-
-                if not queue.empty():
-                    log_data = queue.get_nowait()
-                    message = WebSocketMessage(
-                        message=log_data.get("message", ""),
-                        level=log_data.get("level", "info"),
-                        timestamp=datetime.utcnow(),
-                    )
-                    await websocket.send_json(message.model_dump(mode="json"))
-
-            except Exception:
+                # Block until a message arrives; the timeout doubles as a
+                # liveness probe for half-open connections
+                log_data = await asyncio.wait_for(queue.get(), timeout=30.0)
+            except asyncio.TimeoutError:
+                ping = WebSocketMessage(
+                    message="", level="ping", timestamp=datetime.utcnow()
+                )
+                await websocket.send_json(ping.model_dump(mode="json"))
                 continue
 
+            message = WebSocketMessage(
+                message=log_data.get("message", ""),
+                level=log_data.get("level", "info"),
+                timestamp=datetime.utcnow(),
+            )
+            await websocket.send_json(message.model_dump(mode="json"))
+
     except WebSocketDisconnect:
         pass
     except Exception as e:
@@ -332,35 +386,10 @@ async def search_specs(
     phase: Optional[str] = None,
 ):
     """Search specs by various criteria."""
-    results = []
-
-    projects_to_search = [project] if project else [p.name for p in list_projects()]
-
-    for proj_name in projects_to_search:
-        feature_ids = get_project_features(proj_name)
-
-        for feat_id in feature_ids:
-            # Filter by query in feature ID
-            if query.lower() not in feat_id.lower():
-                continue
-
-            feature = get_feature(feat_id)
-
-            # Filter by status
-            if status and feature and feature.status.value != status:
-                continue
-
-            # Filter by phase
-            if phase and feature and feature.current_phase.value != phase:
-                continue
-
-            results.append({
-                "project": proj_name,
-                "feature_id": feat_id,
-                "status": feature.status.value if feature else "unknown",
-                "phase": feature.current_phase.value if feature else "unknown",
-            })
-
+    # SQLite query: off the loop like every other blocking call
+    results = await asyncio.to_thread(
+        search_features, query, project_name=project, status=status, phase=phase
+    )
     return {"results": results}
 
 
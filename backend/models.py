@@ -2,12 +2,20 @@
 Pydantic models for ClaudeForge API and data structures.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
+# Hoisted so every default factory shares one tzinfo object
+_UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """Aware UTC now; datetime.utcnow is deprecated and slower on 3.12+."""
+    return datetime.now(_UTC)
+
 
 class PhaseStatus(str, Enum):
     """Status states for workflow phases."""
@@ -36,10 +44,17 @@ class ProjectStatus(str, Enum):
     ERROR = "error"
 
 
+# Value -> member maps for the enums decoded in from_row constructors; a
+# dict hit skips the EnumMeta __call__ machinery on trusted read paths.
+_PHASE_STATUS = {member.value: member for member in PhaseStatus}
+_WORKFLOW_PHASE = {member.value: member for member in WorkflowPhase}
+_PROJECT_STATUS = {member.value: member for member in ProjectStatus}
+
+
 class Approval(BaseModel):
     """Approval record for a spec phase."""
     user: str = "system"
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     comment: str = ""
 
 
@@ -51,8 +66,8 @@ class SpecPhase(BaseModel):
     content: str = ""
     approvals: list[Approval] = Field(default_factory=list)
     dependencies: list[str] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
 
 class Project(BaseModel):
@@ -62,6 +77,20 @@ class Project(BaseModel):
     path: str
     status: ProjectStatus = ProjectStatus.ACTIVE
 
+    @classmethod
+    def from_row(cls, row) -> "Project":
+        """Build a Project from a trusted database row without validation.
+
+        Same contract as Feature.from_row: only for rows out of our own
+        database, where the write path has already validated them.
+        """
+        return cls.model_construct(
+            id=row["id"],
+            name=row["name"],
+            path=row["path"],
+            status=_PROJECT_STATUS[row["status"]],
+        )
+
 
 class Feature(BaseModel):
     """Feature record."""
@@ -71,14 +100,31 @@ class Feature(BaseModel):
     description: str
     status: PhaseStatus = PhaseStatus.DRAFT
     current_phase: WorkflowPhase = WorkflowPhase.REQUIREMENTS
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+
+    @classmethod
+    def from_row(cls, row) -> "Feature":
+        """Build a Feature from a trusted database row without validation.
+
+        The schema and the write-path models enforce the invariants, so
+        model_construct skips re-validating them on every read. Only for
+        rows that came out of our own database.
+        """
+        return cls.model_construct(
+            id=row["id"],
+            feature_id=row["feature_id"],
+            project_id=row["project_id"],
+            description=row["description"],
+            status=_PHASE_STATUS[row["status"]],
+            current_phase=_WORKFLOW_PHASE[row["current_phase"]],
+        )
 
 
 class LogEntry(BaseModel):
     """Log entry for agent activity."""
     id: Optional[int] = None
     feature_id: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     message: str
     level: str = "info"
 
@@ -144,4 +190,4 @@ class WebSocketMessage(BaseModel):
     """WebSocket message format."""
     message: str
     level: str = "info"
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
@@ -0,0 +1,171 @@
+"""
+Precompiled prompt templates for the six-phase workflow.
+Templates are compiled once at import; phase code renders them with the
+current feature context instead of rebuilding multi-KB f-strings.
+"""
+
+from jinja2 import DictLoader, Environment
+
+# Characters of previous-phase context included in a prompt
+PHASE_SUMMARY_CHARS = 2000
+
+
+def _truncate_context(text: str, limit: int = PHASE_SUMMARY_CHARS) -> str:
+    """Cap previous-phase context embedded in a prompt."""
+    return text[:limit]
+
+
+_TEMPLATE_SOURCES = {
+    "requirements": """Analyze the following feature request and create comprehensive requirements:
+
+Feature: {{ feature }}
+Project: {{ project }}
+Feature ID: {{ feat_id }}
+
+Create a requirements specification that includes:
+1. Functional requirements (what the feature should do)
+2. Non-functional requirements (performance, security, etc.)
+3. User stories or use cases
+4. Acceptance criteria
+5. Dependencies and constraints
+6. Out of scope items
+
+Output the requirements as a structured YAML-compatible specification.""",
+    "design": """Based on the requirements, create an architectural design:
+
+Feature: {{ feature }}
+Feature ID: {{ feat_id }}
+Project: {{ project }}
+
+Previous Phase - Requirements:
+{{ requirements.summary | truncate_context }}
+
+The design should include:
+1. High-level architecture overview
+2. Component diagram (in Mermaid format)
+3. Data models and schemas
+4. API contracts (if applicable)
+5. Integration points with existing code
+6. Technology decisions and rationale
+
+Output as a structured design document.""",
+    "tasks": """Break down the design into implementation tasks:
+
+Feature ID: {{ feat_id }}
+Project: {{ project }}
+
+Previous Phase - Design:
+{{ design.summary | truncate_context }}
+
+Create a task list that includes:
+1. Task ID and title
+2. Description and acceptance criteria
+3. Files to create or modify
+4. Dependencies on other tasks
+5. Estimated complexity (low/medium/high)
+6. Test requirements
+
+Output as a structured task list.""",
+    "implementation": """Implement the feature according to the task breakdown:
+
+Feature ID: {{ feat_id }}
+Project: {{ project }}
+Project Path: /projects/{{ project }}
+
+Previous Phase - Tasks:
+{{ tasks.summary | truncate_context }}
+(Full task spec on disk: {{ tasks.spec_path }})
+
+For each task:
+1. Read existing code to understand context
+2. Write or modify code as needed
+3. Write tests for new functionality
+4. Commit changes with clear messages
+5. Document any deviations from the plan
+
+Follow coding standards and best practices.""",
+    "verification": """Verify the implementation:
+
+Feature ID: {{ feat_id }}
+Project: {{ project }}
+Project Path: /projects/{{ project }}
+
+Original Requirements:
+{{ requirements.summary | truncate_context(1000) }}
+(Full requirements spec on disk: {{ requirements.spec_path }})
+
+Implementation Summary:
+{{ implementation.summary | truncate_context(1000) }}
+(Full implementation spec on disk: {{ implementation.spec_path }})
+
+Verification steps:
+1. Run all tests and report results
+2. Verify each requirement is met
+3. Check for edge cases
+4. Identify any bugs or issues
+5. Validate code quality
+
+Report findings with pass/fail status for each item.""",
+    "review": """Review the implementation:
+
+Feature ID: {{ feat_id }}
+Project: {{ project }}
+
+Implementation Summary:
+{{ implementation.summary | truncate_context(1000) }}
+(Full implementation spec on disk: {{ implementation.spec_path }})
+
+Review for:
+1. Code quality and maintainability
+2. Adherence to design patterns
+3. Security considerations
+4. Performance implications
+5. Documentation completeness
+6. Improvement suggestions
+
+Provide constructive feedback with specific recommendations.""",
+    "bundle_design": """Based on the requirements section you produced above, create an architectural design:
+
+Feature: {{ feature }}
+Feature ID: {{ feat_id }}
+Project: {{ project }}
+
+The design should include:
+1. High-level architecture overview
+2. Component diagram (in Mermaid format)
+3. Data models and schemas
+4. API contracts (if applicable)
+5. Integration points with existing code
+6. Technology decisions and rationale
+
+Output as a structured design document.""",
+    "bundle_tasks": """Break down the design section you produced above into implementation tasks:
+
+Feature ID: {{ feat_id }}
+Project: {{ project }}
+
+Create a task list that includes:
+1. Task ID and title
+2. Description and acceptance criteria
+3. Files to create or modify
+4. Dependencies on other tasks
+5. Estimated complexity (low/medium/high)
+6. Test requirements
+
+Output as a structured task list.""",
+}
+
+_env = Environment(
+    loader=DictLoader(_TEMPLATE_SOURCES),
+    auto_reload=False,
+    keep_trailing_newline=True,
+)
+_env.filters["truncate_context"] = _truncate_context
+
+# Compile everything up front so rendering is a pure substitution
+_TEMPLATES = {name: _env.get_template(name) for name in _TEMPLATE_SOURCES}
+
+
+def render(phase: str, **context) -> str:
+    """Render the prompt template for a phase with the given context."""
+    return _TEMPLATES[phase].render(**context)
@@ -3,15 +3,80 @@ CrewAI tools for ClaudeForge agents.
 File operations, Git commands, test runners, and spec management.
 """
 
+import asyncio
+import fnmatch
+import mmap
 import os
+import re
+import shutil
 import subprocess
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
 from crewai.tools import tool
 
+try:
+    # libgit2 bindings keep status/commit/diff in-process; subprocess git
+    # remains the fallback when the wheel is absent
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 PROJECTS_PATH = os.getenv("PROJECTS_PATH", "/projects")
 
+# read_file returns a Python string to the agent; refuse files that would
+# balloon RSS (and the prompt) rather than slurping them
+MAX_READ_FILE_SIZE = 10 * 1024 * 1024  # 10 MiB
+
+# Reads above this size decode straight off an mmap'd view, skipping the
+# intermediate read() buffer copy; small files aren't worth the map setup
+MMAP_READ_THRESHOLD = 64 * 1024
+
+# Upper bound on subprocesses spawned concurrently by one event loop, so a
+# gather() over many projects doesn't fork-bomb the container
+SUBPROCESS_LIMIT = 8
+
+_sems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _sem() -> asyncio.Semaphore:
+    """Per-loop semaphore bounding concurrent subprocesses."""
+    loop = asyncio.get_running_loop()
+    sem = _sems.get(loop)
+    if sem is None:
+        sem = _sems[loop] = asyncio.Semaphore(SUBPROCESS_LIMIT)
+    return sem
+
+
+async def _arun(
+    cmd: list[str], cwd: Path, timeout: float
+) -> subprocess.CompletedProcess:
+    """Run a command without blocking the event loop.
+
+    Coroutines awaiting several commands overlap their wait time, so a
+    batch of git calls costs roughly the slowest one instead of the sum.
+    """
+    async with _sem():
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(
+        cmd, proc.returncode, stdout.decode(), stderr.decode()
+    )
+
 
 @tool("Read File")
 def read_file(file_path: str) -> str:
@@ -35,6 +100,19 @@ def read_file(file_path: str) -> str:
         if not path.is_file():
             return f"Error: Not a file: {file_path}"
 
+        size = path.stat().st_size
+        if size > MAX_READ_FILE_SIZE:
+            return (
+                f"Error: File too large to read ({size} bytes, "
+                f"limit {MAX_READ_FILE_SIZE}): {file_path}"
+            )
+
+        if size > MMAP_READ_THRESHOLD:
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                return mm[:].decode("utf-8", errors="replace")
+
         with open(path) as f:
             return f.read()
     except Exception as e:
@@ -60,8 +138,13 @@ def write_file(file_path: str, content: str) -> str:
 
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w") as f:
-            f.write(content)
+        # Single write syscall on a raw fd; skips the TextIOWrapper layer
+        payload = content.encode()
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
 
         return f"Successfully wrote to {file_path}"
     except Exception as e:
@@ -89,16 +172,25 @@ def edit_file(file_path: str, old_text: str, new_text: str) -> str:
         if not path.exists():
             return f"Error: File not found: {file_path}"
 
-        with open(path) as f:
-            content = f.read()
-
-        if old_text not in content:
-            return f"Error: Text not found in {file_path}"
-
-        new_content = content.replace(old_text, new_text, 1)
-
-        with open(path, "w") as f:
-            f.write(new_content)
+        # The search runs over the mapped bytes (memmem in C); only the
+        # replacement splice materializes a new buffer
+        old = old_text.encode()
+        with open(path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                return f"Error: Text not found in {file_path}"
+            with mm:
+                idx = mm.find(old)
+                if idx < 0:
+                    return f"Error: Text not found in {file_path}"
+                payload = mm[:idx] + new_text.encode() + mm[idx + len(old):]
+
+        fd = os.open(path, os.O_WRONLY | os.O_TRUNC)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
 
         return f"Successfully edited {file_path}"
     except Exception as e:
@@ -127,39 +219,107 @@ def list_directory(dir_path: str) -> str:
         if not path.is_dir():
             return f"Error: Not a directory: {dir_path}"
 
-        items = []
-        for item in sorted(path.iterdir()):
-            prefix = "[DIR] " if item.is_dir() else "[FILE]"
-            items.append(f"{prefix} {item.name}")
+        # scandir answers is_dir from the dirent data instead of a stat
+        # per entry; the single join was already in place
+        with os.scandir(path) as it:
+            items = [
+                f"{'[DIR] ' if entry.is_dir() else '[FILE]'} {entry.name}"
+                for entry in sorted(it, key=lambda e: e.name)
+            ]
 
         return "\n".join(items) if items else "(empty directory)"
     except Exception as e:
         return f"Error listing directory: {e}"
 
 
-@tool("Git Status")
-def git_status(project_path: str) -> str:
-    """
-    Get git status for a project.
+# Repository handles are cached so libgit2 reuses its odb/index caches
+# across the git calls an agent chains on one project
+_repo_cache: dict = {}
+
+
+def _repo(path: Path):
+    key = str(path)
+    repo = _repo_cache.get(key)
+    if repo is None:
+        repo = _repo_cache[key] = pygit2.Repository(key)
+    return repo
+
+
+def _pygit2_status(path: Path) -> str:
+    """git status --porcelain equivalent via libgit2."""
+    entries = _repo(path).status()
+    lines = []
+    for name, flags in sorted(entries.items()):
+        if flags & pygit2.GIT_STATUS_IGNORED:
+            continue
+        if flags & pygit2.GIT_STATUS_WT_NEW:
+            lines.append(f"?? {name}")
+            continue
+        staged = (
+            "A" if flags & pygit2.GIT_STATUS_INDEX_NEW
+            else "M" if flags & pygit2.GIT_STATUS_INDEX_MODIFIED
+            else "D" if flags & pygit2.GIT_STATUS_INDEX_DELETED
+            else "R" if flags & pygit2.GIT_STATUS_INDEX_RENAMED
+            else " "
+        )
+        worktree = (
+            "M" if flags & pygit2.GIT_STATUS_WT_MODIFIED
+            else "D" if flags & pygit2.GIT_STATUS_WT_DELETED
+            else " "
+        )
+        lines.append(f"{staged}{worktree} {name}")
+    if not lines:
+        return "Working tree clean"
+    return "\n".join(lines) + "\n"
+
+
+def _pygit2_commit(path: Path, message: str, files: Optional[str]) -> str:
+    """Stage and commit via libgit2."""
+    repo = _repo(path)
+    index = repo.index
+    if files:
+        for name in files.split():
+            index.add(name)
+    else:
+        index.add_all()
+    index.write()
+    tree = index.write_tree()
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    if parents and repo[parents[0]].tree_id == tree:
+        return "Nothing to commit"
+    signature = repo.default_signature
+    repo.create_commit("HEAD", signature, signature, message, tree, parents)
+    return f"Committed: {message}"
+
+
+def _pygit2_diff(path: Path, file_path: Optional[str]) -> str:
+    """Worktree diff via libgit2, optionally filtered to one file."""
+    diff = _repo(path).diff()
+    if file_path:
+        text = "".join(
+            patch.text
+            for patch in diff
+            if file_path in (patch.delta.new_file.path, patch.delta.old_file.path)
+        )
+    else:
+        text = diff.patch or ""
+    return text if text else "No changes"
 
-    Args:
-        project_path: Path to the project directory.
 
-    Returns:
-        Git status output or error.
-    """
+async def git_status_async(project_path: str) -> str:
+    """Async core of git_status; gather() several for concurrent repos."""
     try:
         path = Path(project_path)
         if not path.is_absolute():
             path = Path(PROJECTS_PATH) / project_path
 
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=path,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        if pygit2 is not None:
+            try:
+                return _pygit2_status(path)
+            except Exception:
+                pass  # fall back to subprocess git
+
+        result = await _arun(["git", "status", "--porcelain"], cwd=path, timeout=30)
 
         if result.returncode != 0:
             return f"Git error: {result.stderr}"
@@ -171,51 +331,43 @@ def git_status(project_path: str) -> str:
         return f"Error running git status: {e}"
 
 
-@tool("Git Commit")
-def git_commit(project_path: str, message: str, files: Optional[str] = None) -> str:
+@tool("Git Status")
+def git_status(project_path: str) -> str:
     """
-    Stage and commit changes to git.
+    Get git status for a project.
 
     Args:
         project_path: Path to the project directory.
-        message: Commit message.
-        files: Optional space-separated list of files to stage. If not provided, stages all changes.
 
     Returns:
-        Commit result or error.
+        Git status output or error.
     """
+    return asyncio.run(git_status_async(project_path))
+
+
+async def git_commit_async(
+    project_path: str, message: str, files: Optional[str] = None
+) -> str:
+    """Async core of git_commit: stage then commit, chained with await."""
     try:
         path = Path(project_path)
         if not path.is_absolute():
             path = Path(PROJECTS_PATH) / project_path
 
+        if pygit2 is not None:
+            try:
+                return _pygit2_commit(path, message, files)
+            except Exception:
+                pass  # fall back to subprocess git
+
         # Stage files
         if files:
-            file_list = files.split()
-            subprocess.run(
-                ["git", "add"] + file_list,
-                cwd=path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            await _arun(["git", "add"] + files.split(), cwd=path, timeout=30)
         else:
-            subprocess.run(
-                ["git", "add", "-A"],
-                cwd=path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            await _arun(["git", "add", "-A"], cwd=path, timeout=30)
 
         # Commit
-        result = subprocess.run(
-            ["git", "commit", "-m", message],
-            cwd=path,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        result = await _arun(["git", "commit", "-m", message], cwd=path, timeout=30)
 
         if result.returncode != 0:
             if "nothing to commit" in result.stdout or "nothing to commit" in result.stderr:
@@ -229,34 +381,40 @@ def git_commit(project_path: str, message: str, files: Optional[str] = None) ->
         return f"Error running git commit: {e}"
 
 
-@tool("Git Diff")
-def git_diff(project_path: str, file_path: Optional[str] = None) -> str:
+@tool("Git Commit")
+def git_commit(project_path: str, message: str, files: Optional[str] = None) -> str:
     """
-    Get git diff for changes.
+    Stage and commit changes to git.
 
     Args:
         project_path: Path to the project directory.
-        file_path: Optional specific file to diff.
+        message: Commit message.
+        files: Optional space-separated list of files to stage. If not provided, stages all changes.
 
     Returns:
-        Diff output or error.
+        Commit result or error.
     """
+    return asyncio.run(git_commit_async(project_path, message, files))
+
+
+async def git_diff_async(project_path: str, file_path: Optional[str] = None) -> str:
+    """Async core of git_diff."""
     try:
         path = Path(project_path)
         if not path.is_absolute():
             path = Path(PROJECTS_PATH) / project_path
 
+        if pygit2 is not None:
+            try:
+                return _pygit2_diff(path, file_path)
+            except Exception:
+                pass  # fall back to subprocess git
+
         cmd = ["git", "diff"]
         if file_path:
             cmd.append(file_path)
 
-        result = subprocess.run(
-            cmd,
-            cwd=path,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        result = await _arun(cmd, cwd=path, timeout=30)
 
         return result.stdout if result.stdout else "No changes"
     except subprocess.TimeoutExpired:
@@ -265,18 +423,25 @@ def git_diff(project_path: str, file_path: Optional[str] = None) -> str:
         return f"Error running git diff: {e}"
 
 
-@tool("Run Tests")
-def run_tests(project_path: str, test_command: Optional[str] = None) -> str:
+@tool("Git Diff")
+def git_diff(project_path: str, file_path: Optional[str] = None) -> str:
     """
-    Run tests for a project.
+    Get git diff for changes.
 
     Args:
         project_path: Path to the project directory.
-        test_command: Optional custom test command. Defaults to auto-detection.
+        file_path: Optional specific file to diff.
 
     Returns:
-        Test output or error.
+        Diff output or error.
     """
+    return asyncio.run(git_diff_async(project_path, file_path))
+
+
+async def run_tests_async(
+    project_path: str, test_command: Optional[str] = None
+) -> str:
+    """Async core of run_tests."""
     try:
         path = Path(project_path)
         if not path.is_absolute():
@@ -293,13 +458,8 @@ def run_tests(project_path: str, test_command: Optional[str] = None) -> str:
             else:
                 return "Error: Could not detect test framework"
 
-        result = subprocess.run(
-            test_command.split(),
-            cwd=path,
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout for tests
-        )
+        # 5 minute timeout for tests
+        result = await _arun(test_command.split(), cwd=path, timeout=300)
 
         output = result.stdout + result.stderr
         status = "PASSED" if result.returncode == 0 else "FAILED"
@@ -311,6 +471,153 @@ def run_tests(project_path: str, test_command: Optional[str] = None) -> str:
         return f"Error running tests: {e}"
 
 
+@tool("Run Tests")
+def run_tests(project_path: str, test_command: Optional[str] = None) -> str:
+    """
+    Run tests for a project.
+
+    Args:
+        project_path: Path to the project directory.
+        test_command: Optional custom test command. Defaults to auto-detection.
+
+    Returns:
+        Test output or error.
+    """
+    return asyncio.run(run_tests_async(project_path, test_command))
+
+
+# ripgrep does the heavy scanning in native code when available; detected
+# once at import so the hot path doesn't re-probe PATH
+_RIPGREP = shutil.which("rg")
+
+MAX_SEARCH_RESULTS = 50
+
+
+def _search_with_rg(path: Path, pattern: str, file_pattern: str) -> Optional[list[str]]:
+    """Search via ripgrep; returns None if rg failed and the caller should fall back.
+
+    rg skips hidden files and respects .gitignore by default, matching the
+    Python path's dotfile filtering while also pruning vendored trees.
+    """
+    cmd = [_RIPGREP, "--no-heading", "-n", "-F", "-m", str(MAX_SEARCH_RESULTS)]
+    if file_pattern != "*":
+        cmd += ["--glob", file_pattern]
+    cmd += [pattern, "."]
+
+    result = subprocess.run(
+        cmd, cwd=path, capture_output=True, text=True, timeout=60
+    )
+    if result.returncode not in (0, 1):
+        return None
+
+    results = []
+    for raw in result.stdout.splitlines():
+        rel_path, line_no, text = raw.split(":", 2)
+        results.append(f"{rel_path.removeprefix('./')}:{line_no}: {text.strip()}")
+        if len(results) >= MAX_SEARCH_RESULTS:
+            break
+    return results
+
+
+def _scan_file(file_path: Path, root: Path, pattern: bytes) -> list[str]:
+    """Return matches from one file, located via mmap and bytes.find.
+
+    The scan stays in C (memmem over the mapped pages); only the matched
+    lines are decoded. A line that fails to decode marks the file binary
+    and ends the scan.
+    """
+    matches: list[str] = []
+    try:
+        if file_path.stat().st_size > MAX_SEARCH_FILE_SIZE:
+            return matches
+        with open(file_path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                return matches
+    except (OSError, PermissionError):
+        return matches
+
+    with mm:
+        rel_path = file_path.relative_to(root)
+        line_no = 1
+        counted_to = 0
+        pos = 0
+        while len(matches) < MAX_SEARCH_RESULTS:
+            idx = mm.find(pattern, pos)
+            if idx < 0:
+                break
+            line_no += mm[counted_to:idx].count(b"\n")
+            counted_to = idx
+            start = mm.rfind(b"\n", 0, idx) + 1
+            end = mm.find(b"\n", idx)
+            if end < 0:
+                end = mm.size()
+            try:
+                line = mm[start:end].decode()
+            except UnicodeDecodeError:
+                return []
+            matches.append(f"{rel_path}:{line_no}: {line.strip()}")
+            pos = end + 1
+    return matches
+
+
+# Vendored/build trees pruned from traversal and extensions that are never
+# worth opening; both cut thousands of wasted syscalls on real repos
+SEARCH_SKIP_DIRS = {
+    "node_modules", "__pycache__", "venv", "dist", "build", "target",
+}
+BINARY_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg", ".pdf", ".zip",
+    ".tar", ".gz", ".whl", ".so", ".pyc", ".db", ".sqlite", ".woff",
+    ".woff2", ".ttf", ".mp4", ".bin", ".exe",
+}
+MAX_SEARCH_FILE_SIZE = 2 * 1024 * 1024  # 2 MiB
+
+
+SEARCH_SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+def _search_python(path: Path, pattern: str, file_pattern: str) -> list[str]:
+    """Pure-Python search used when ripgrep is unavailable.
+
+    Candidate files are collected first, then scanned on a thread pool —
+    the GIL is released during the reads, so per-file I/O overlaps.
+    """
+    pattern_bytes = pattern.encode()
+    candidates: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(path):
+        # In-place pruning stops os.walk from descending at all
+        dirnames[:] = [
+            d for d in dirnames
+            if not d.startswith(".") and d not in SEARCH_SKIP_DIRS
+        ]
+        for name in filenames:
+            if name.startswith(".") or not fnmatch.fnmatch(name, file_pattern):
+                continue
+            if os.path.splitext(name)[1].lower() in BINARY_EXTENSIONS:
+                continue
+            candidates.append(Path(dirpath) / name)
+
+    results: list[str] = []
+    if not candidates:
+        return results
+
+    workers = min(SEARCH_SCAN_WORKERS, len(candidates))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_scan_file, file_path, path, pattern_bytes)
+            for file_path in candidates
+        ]
+        for future in as_completed(futures):
+            results.extend(future.result())
+            if len(results) >= MAX_SEARCH_RESULTS:
+                for pending in futures:
+                    pending.cancel()
+                break
+    return results[:MAX_SEARCH_RESULTS]
+
+
 @tool("Search Files")
 def search_files(project_path: str, pattern: str, file_pattern: str = "*") -> str:
     """
@@ -329,21 +636,13 @@ def search_files(project_path: str, pattern: str, file_pattern: str = "*") -> st
         if not path.is_absolute():
             path = Path(PROJECTS_PATH) / project_path
 
-        results = []
-        for file_path in path.rglob(file_pattern):
-            if file_path.is_file() and not any(
-                part.startswith(".") for part in file_path.parts
-            ):
-                try:
-                    with open(file_path) as f:
-                        for i, line in enumerate(f, 1):
-                            if pattern in line:
-                                rel_path = file_path.relative_to(path)
-                                results.append(f"{rel_path}:{i}: {line.strip()}")
-                except (UnicodeDecodeError, PermissionError):
-                    continue
-
-        return "\n".join(results[:50]) if results else f"No matches found for '{pattern}'"
+        results = None
+        if _RIPGREP:
+            results = _search_with_rg(path, pattern, file_pattern)
+        if results is None:
+            results = _search_python(path, pattern, file_pattern)
+
+        return "\n".join(results) if results else f"No matches found for '{pattern}'"
     except Exception as e:
         return f"Error searching files: {e}"
 
@@ -398,6 +697,17 @@ def delete_file(file_path: str) -> str:
         return f"Error deleting file: {e}"
 
 
+# All Dockerfile checks folded into one compiled alternation: a single
+# regex pass over the raw bytes replaces per-line Python iteration
+_DOCKER_RULES = re.compile(
+    rb"(?P<from_line>^[ \t]*FROM[ \t][^\n]*)"
+    rb"|(?P<user>^[ \t]*USER[ \t])"
+    rb"|(?P<healthcheck>^[ \t]*HEALTHCHECK[ \t])"
+    rb"|(?P<copy_all>(?:COPY|ADD) \. \.)",
+    re.MULTILINE,
+)
+
+
 @tool("Check Docker Standards")
 def check_docker_standards(dockerfile_path: str) -> str:
     """
@@ -417,34 +727,37 @@ def check_docker_standards(dockerfile_path: str) -> str:
         if not path.exists():
             return f"Error: Dockerfile not found: {dockerfile_path}"
 
-        with open(path) as f:
-            content = f.read()
+        data = path.read_bytes()
 
         issues = []
         recommendations = []
 
-        # Check for multi-stage build
-        if "FROM" in content and content.count("FROM") < 2:
-            recommendations.append("Consider using multi-stage build for smaller images")
+        from_count = 0
+        has_user = False
+        has_healthcheck = False
+        copies_everything = False
+        for mo in _DOCKER_RULES.finditer(data):
+            kind = mo.lastgroup
+            if kind == "from_line":
+                from_count += 1
+                if b":latest" in mo.group():
+                    issues.append("Using :latest tag - pin to specific version")
+            elif kind == "user":
+                has_user = True
+            elif kind == "healthcheck":
+                has_healthcheck = True
+            else:
+                copies_everything = True
 
-        # Check for non-root user
-        if "USER" not in content:
+        if from_count == 1:
+            recommendations.append("Consider using multi-stage build for smaller images")
+        if not has_user:
             issues.append("No non-root USER specified (security risk)")
-
-        # Check for HEALTHCHECK
-        if "HEALTHCHECK" not in content:
+        if not has_healthcheck:
             recommendations.append("Add HEALTHCHECK for container health monitoring")
-
-        # Check for .dockerignore mention
-        if "COPY . ." in content or "ADD . ." in content:
+        if copies_everything:
             recommendations.append("Ensure .dockerignore is configured to exclude unnecessary files")
 
-        # Check for pinned versions
-        lines = content.split("\n")
-        for line in lines:
-            if line.startswith("FROM") and ":latest" in line:
-                issues.append("Using :latest tag - pin to specific version")
-
         result = "Docker Standards Check:\n"
         if issues:
             result += "\nISSUES:\n" + "\n".join(f"- {i}" for i in issues)
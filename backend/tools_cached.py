@@ -0,0 +1,136 @@
+"""
+Per-workflow caching wrappers around the filesystem tools.
+
+The Architect and Developer agents call the same read-only tools on the
+same paths over and over within a single workflow ("search then read"
+loops). Caching results per feature ID skips the repeated directory
+walks; mutating tools invalidate any cached entry that references the
+touched path so agents never see stale reads.
+"""
+
+import copy
+import functools
+from contextvars import ContextVar
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from cachetools import TTLCache
+
+import tools
+
+# Feature whose workflow is executing in the current context; set by
+# agents.execute_phase before the crew runs its tools
+current_feat_id: ContextVar[Optional[str]] = ContextVar(
+    "current_feat_id", default=None
+)
+
+TOOL_CACHE_SIZE = 1024
+TOOL_CACHE_TTL_SECONDS = 300.0
+
+_cache: TTLCache = TTLCache(maxsize=TOOL_CACHE_SIZE, ttl=TOOL_CACHE_TTL_SECONDS)
+_lock = Lock()
+
+
+def _resolve(path_str: str) -> str:
+    """Resolve a tool path argument the same way tools.py does."""
+    path = Path(path_str)
+    if not path.is_absolute():
+        path = Path(tools.PROJECTS_PATH) / path_str
+    return str(path)
+
+
+def _touches(mutated: str, arg: str) -> bool:
+    """Whether a cached call whose argument was arg could see mutated."""
+    referenced = _resolve(arg)
+    return mutated == referenced or mutated.startswith(referenced + "/")
+
+
+def invalidate(feat_id: str, path: str) -> None:
+    """Drop cached entries for a feature that reference the mutated path.
+
+    A write under a directory also invalidates listings and searches of
+    any ancestor directory, since those results included the old state.
+    """
+    mutated = _resolve(path)
+    with _lock:
+        stale = [
+            key
+            for key in _cache
+            if key[0] == feat_id and any(_touches(mutated, arg) for arg in key[2])
+        ]
+        for key in stale:
+            del _cache[key]
+
+
+def _cache_key(feat_id: str, name: str, args: tuple, kwargs: dict) -> tuple:
+    arg_values = tuple(str(a) for a in args) + tuple(
+        str(value) for _, value in sorted(kwargs.items())
+    )
+    return (feat_id, name, arg_values)
+
+
+def _wrap_cached(tool_obj):
+    """Serve a read-only tool's results from the per-feature cache.
+
+    Wraps a copy of the tool so the original in tools.py keeps its
+    uncached implementation.
+    """
+    inner = tool_obj.func
+    name = tool_obj.name
+
+    @functools.wraps(inner)
+    def wrapper(*args, **kwargs):
+        feat_id = current_feat_id.get()
+        if feat_id is None:
+            return inner(*args, **kwargs)
+
+        key = _cache_key(feat_id, name, args, kwargs)
+        with _lock:
+            if key in _cache:
+                return _cache[key]
+
+        result = inner(*args, **kwargs)
+        with _lock:
+            _cache[key] = result
+        return result
+
+    wrapped = copy.copy(tool_obj)
+    wrapped.func = wrapper
+    return wrapped
+
+
+def _wrap_invalidating(tool_obj):
+    """Invalidate cached entries referencing the path a mutating tool touched.
+
+    Wraps a copy of the tool so the original in tools.py keeps its
+    non-invalidating implementation.
+    """
+    inner = tool_obj.func
+
+    @functools.wraps(inner)
+    def wrapper(*args, **kwargs):
+        result = inner(*args, **kwargs)
+        feat_id = current_feat_id.get()
+        if feat_id is not None:
+            path = args[0] if args else kwargs.get("file_path", kwargs.get("dir_path"))
+            if path is not None:
+                invalidate(feat_id, path)
+        return result
+
+    wrapped = copy.copy(tool_obj)
+    wrapped.func = wrapper
+    return wrapped
+
+
+# Read-only tools served from the cache
+read_file = _wrap_cached(tools.read_file)
+search_files = _wrap_cached(tools.search_files)
+list_directory = _wrap_cached(tools.list_directory)
+check_docker_standards = _wrap_cached(tools.check_docker_standards)
+
+# Mutating tools drop stale entries for the touched path
+write_file = _wrap_invalidating(tools.write_file)
+edit_file = _wrap_invalidating(tools.edit_file)
+create_directory = _wrap_invalidating(tools.create_directory)
+delete_file = _wrap_invalidating(tools.delete_file)
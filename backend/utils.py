@@ -2,46 +2,112 @@
 Utility functions for ClaudeForge.
 """
 
+import asyncio
+import functools
 import os
 import re
-from datetime import datetime
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
 from pathlib import Path
+from threading import Lock
 from typing import Optional
 
+import orjson
 import yaml
 
+try:
+    # libyaml bindings keep the legacy read path out of the Python state machine
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from db import get_next_feature_number
 from models import Approval, PhaseStatus, SpecPhase, WorkflowPhase
 
 PROJECTS_PATH = os.getenv("PROJECTS_PATH", "/projects")
 
+# Compiled once; validate_feature_id runs on most API requests
+_FEAT_ID_RE = re.compile(r"^FEAT-\d{8}-\d{3}$")
+
+
+# Today's UTC date string, recomputed only when the day number changes
+_today_cache: tuple[int, str] = (-1, "")
+
+
+def _today_utc() -> str:
+    global _today_cache
+    day = int(time.time() // 86400)
+    if _today_cache[0] != day:
+        _today_cache = (day, datetime.now(timezone.utc).strftime("%Y%m%d"))
+    return _today_cache[1]
+
 
 def generate_feat_id() -> str:
     """
     Generate a unique feature ID in format FEAT-YYYYMMDD-NNN.
     NNN is incremented via SQLite counter.
     """
-    today = datetime.utcnow().strftime("%Y%m%d")
     number = get_next_feature_number()
-    return f"FEAT-{today}-{number:03d}"
+    return f"FEAT-{_today_utc()}-{number:03d}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _spec_dir(projects_path: str, project_name: str, feat_id: str) -> Path:
+    """Build a feature's spec path once; repeat calls reuse the Path.
+
+    Keyed on the projects path so the cache stays correct if
+    PROJECTS_PATH is repointed (as the tests do).
+    """
+    return Path(projects_path) / project_name / ".spec-workflow" / "specs" / feat_id
 
 
 def get_spec_dir(project_name: str, feat_id: str) -> Path:
     """Get the spec directory path for a feature."""
-    return Path(PROJECTS_PATH) / project_name / ".spec-workflow" / "specs" / feat_id
+    return _spec_dir(PROJECTS_PATH, project_name, feat_id)
 
 
-def ensure_spec_dir(project_name: str, feat_id: str) -> Path:
-    """Ensure spec directory exists and return path."""
-    spec_dir = get_spec_dir(project_name, feat_id)
+@functools.lru_cache(maxsize=256)
+def _ensured_spec_dir(projects_path: str, project_name: str, feat_id: str) -> Path:
+    """Resolve and create a spec directory once per feature.
+
+    Keyed on the projects path so the cache stays correct if PROJECTS_PATH
+    is repointed (as the tests do).
+    """
+    spec_dir = _spec_dir(projects_path, project_name, feat_id)
     spec_dir.mkdir(parents=True, exist_ok=True)
     return spec_dir
 
 
+def ensure_spec_dir(project_name: str, feat_id: str) -> Path:
+    """Ensure spec directory exists and return path."""
+    return _ensured_spec_dir(PROJECTS_PATH, project_name, feat_id)
+
+
+def _phase_filename(phase: WorkflowPhase) -> str:
+    return f"phase-{phase.value}.json"
+
+
 def get_phase_file(project_name: str, feat_id: str, phase: WorkflowPhase) -> Path:
     """Get the file path for a phase spec."""
     spec_dir = get_spec_dir(project_name, feat_id)
-    return spec_dir / f"phase-{phase.value}.yaml"
+    return spec_dir / _phase_filename(phase)
+
+
+def _write_spec_file(phase_file: Path, payload: bytes) -> None:
+    """Write spec bytes atomically with a single write syscall.
+
+    Writes to a sibling temp file and renames it into place so readers
+    never observe a half-written spec.
+    """
+    # Per-process temp name: concurrent writers each rename their own file
+    tmp_file = phase_file.with_name(f"{phase_file.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+    os.replace(tmp_file, phase_file)
 
 
 def write_phase_spec(
@@ -52,9 +118,10 @@ def write_phase_spec(
     status: PhaseStatus = PhaseStatus.DRAFT,
     dependencies: Optional[list[str]] = None,
 ) -> SpecPhase:
-    """Write a phase specification to YAML file."""
-    ensure_spec_dir(project_name, feat_id)
-    phase_file = get_phase_file(project_name, feat_id, phase)
+    """Write a phase specification to its JSON spec file."""
+    # The ensured dir is the phase file's parent; reuse it rather than
+    # rebuilding the whole path through get_phase_file
+    phase_file = ensure_spec_dir(project_name, feat_id) / _phase_filename(phase)
 
     now = datetime.utcnow()
     spec = SpecPhase(
@@ -70,41 +137,47 @@ def write_phase_spec(
         updated_at=now,
     )
 
-    # Convert to dict for YAML
-    spec_dict = {
-        "feature_id": spec.feature_id,
-        "phase": spec.phase.value,
-        "status": spec.status.value,
-        "content": spec.content,
-        "approvals": [
-            {
-                "user": a.user,
-                "timestamp": a.timestamp.isoformat(),
-                "comment": a.comment,
-            }
-            for a in spec.approvals
-        ],
-        "dependencies": spec.dependencies,
-        "created_at": spec.created_at.isoformat(),
-        "updated_at": spec.updated_at.isoformat(),
-    }
-
-    with open(phase_file, "w") as f:
-        yaml.dump(spec_dict, f, default_flow_style=False, sort_keys=False)
+    # pydantic-core serializes the model (enums, timestamps and the
+    # approvals list) in compiled code; the shape matches the hand-built
+    # dict this replaced
+    _write_spec_file(phase_file, spec.model_dump_json(indent=2).encode())
+    _invalidate_spec_cache(project_name, feat_id, phase)
 
     return spec
 
 
-def read_phase_spec(project_name: str, feat_id: str, phase: WorkflowPhase) -> Optional[SpecPhase]:
-    """Read a phase specification from YAML file."""
-    phase_file = get_phase_file(project_name, feat_id, phase)
+# Parsed specs keyed by location; entries carry (mtime_ns, size) so an
+# on-disk change is a plain miss. calculate_progress and get_all_phase_specs
+# reread every phase per call, so unchanged specs cost one stat() here.
+SPEC_CACHE_SIZE = 1024
 
-    if not phase_file.exists():
+_spec_cache: OrderedDict[tuple, tuple[tuple[int, int], SpecPhase]] = OrderedDict()
+_spec_cache_lock = Lock()
+
+
+def _spec_cache_key(project_name: str, feat_id: str, phase: WorkflowPhase) -> tuple:
+    return (PROJECTS_PATH, project_name, feat_id, phase)
+
+
+def _invalidate_spec_cache(project_name: str, feat_id: str, phase: WorkflowPhase) -> None:
+    """Drop the cached parse after the spec file is rewritten."""
+    with _spec_cache_lock:
+        _spec_cache.pop(_spec_cache_key(project_name, feat_id, phase), None)
+
+
+def _load_spec_dict(phase_file: Path) -> Optional[dict]:
+    """Load the raw spec dict, trying the legacy YAML file if needed."""
+    if phase_file.exists():
+        return orjson.loads(phase_file.read_bytes())
+    legacy_file = phase_file.with_suffix(".yaml")
+    if not legacy_file.exists():
         return None
+    with open(legacy_file) as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
-    with open(phase_file) as f:
-        data = yaml.safe_load(f)
 
+def _dict_to_spec(data: dict) -> SpecPhase:
+    """Materialize a SpecPhase from the raw on-disk dict."""
     return SpecPhase(
         feature_id=data["feature_id"],
         phase=WorkflowPhase(data["phase"]),
@@ -119,11 +192,55 @@ def read_phase_spec(project_name: str, feat_id: str, phase: WorkflowPhase) -> Op
             for a in data.get("approvals", [])
         ],
         dependencies=data.get("dependencies", []),
-        created_at=datetime.fromisoformat(data.get("created_at", datetime.utcnow().isoformat())),
-        updated_at=datetime.fromisoformat(data.get("updated_at", datetime.utcnow().isoformat())),
+        created_at=datetime.fromisoformat(
+            data.get("created_at", datetime.utcnow().isoformat())
+        ),
+        updated_at=datetime.fromisoformat(
+            data.get("updated_at", datetime.utcnow().isoformat())
+        ),
     )
 
 
+def read_phase_spec(project_name: str, feat_id: str, phase: WorkflowPhase) -> Optional[SpecPhase]:
+    """Read a phase specification, falling back to legacy YAML files."""
+    phase_file = get_phase_file(project_name, feat_id, phase)
+
+    source = phase_file
+    try:
+        st = source.stat()
+    except FileNotFoundError:
+        # Specs written before the JSON switch stay readable in place
+        source = phase_file.with_suffix(".yaml")
+        try:
+            st = source.stat()
+        except FileNotFoundError:
+            return None
+
+    key = _spec_cache_key(project_name, feat_id, phase)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _spec_cache_lock:
+        entry = _spec_cache.get(key)
+        if entry is not None and entry[0] == stamp:
+            _spec_cache.move_to_end(key)
+            return entry[1]
+
+    if source is phase_file:
+        data = orjson.loads(source.read_bytes())
+    else:
+        with open(source) as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+
+    spec = _dict_to_spec(data)
+
+    with _spec_cache_lock:
+        _spec_cache[key] = (stamp, spec)
+        _spec_cache.move_to_end(key)
+        while len(_spec_cache) > SPEC_CACHE_SIZE:
+            _spec_cache.popitem(last=False)
+
+    return spec
+
+
 def update_phase_status(
     project_name: str,
     feat_id: str,
@@ -132,40 +249,29 @@ def update_phase_status(
     comment: str = "",
     user: str = "system",
 ) -> Optional[SpecPhase]:
-    """Update the status of a phase spec and add approval record."""
-    spec = read_phase_spec(project_name, feat_id, phase)
-    if not spec:
+    """Update the status of a phase spec and add approval record.
+
+    Works on the raw dict so the write path skips SpecPhase
+    materialization; only the returned value is built into a model.
+    """
+    phase_file = get_phase_file(project_name, feat_id, phase)
+    data = _load_spec_dict(phase_file)
+    if not data:
         return None
 
-    spec.status = status
-    spec.updated_at = datetime.utcnow()
-    spec.approvals.append(
-        Approval(user=user, timestamp=datetime.utcnow(), comment=comment)
+    now = datetime.utcnow().isoformat()
+    data["status"] = status.value
+    data["updated_at"] = now
+    data.setdefault("approvals", []).append(
+        {"user": user, "timestamp": now, "comment": comment}
     )
 
-    phase_file = get_phase_file(project_name, feat_id, phase)
-    spec_dict = {
-        "feature_id": spec.feature_id,
-        "phase": spec.phase.value,
-        "status": spec.status.value,
-        "content": spec.content,
-        "approvals": [
-            {
-                "user": a.user,
-                "timestamp": a.timestamp.isoformat(),
-                "comment": a.comment,
-            }
-            for a in spec.approvals
-        ],
-        "dependencies": spec.dependencies,
-        "created_at": spec.created_at.isoformat(),
-        "updated_at": spec.updated_at.isoformat(),
-    }
-
-    with open(phase_file, "w") as f:
-        yaml.dump(spec_dict, f, default_flow_style=False, sort_keys=False)
+    _write_spec_file(
+        phase_file, orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    )
+    _invalidate_spec_cache(project_name, feat_id, phase)
 
-    return spec
+    return _dict_to_spec(data)
 
 
 def get_all_phase_specs(project_name: str, feat_id: str) -> dict[str, SpecPhase]:
@@ -178,32 +284,67 @@ def get_all_phase_specs(project_name: str, feat_id: str) -> dict[str, SpecPhase]
     return specs
 
 
-def scan_projects() -> list[str]:
-    """Scan the projects directory for available projects."""
-    projects_dir = Path(PROJECTS_PATH)
-    if not projects_dir.exists():
-        return []
+async def read_all_phase_specs(project_name: str, feat_id: str) -> dict[str, SpecPhase]:
+    """Read every phase spec concurrently without blocking the event loop.
 
-    projects = []
-    for item in projects_dir.iterdir():
-        if item.is_dir() and not item.name.startswith("."):
-            projects.append(item.name)
+    The per-phase open+parse syscalls overlap on the thread pool instead
+    of running back to back; cache hits (see read_phase_spec) return
+    immediately.
+    """
+    phases = list(WorkflowPhase)
+    specs = await asyncio.gather(
+        *(
+            asyncio.to_thread(read_phase_spec, project_name, feat_id, phase)
+            for phase in phases
+        )
+    )
+    return {phase.value: spec for phase, spec in zip(phases, specs) if spec}
 
-    return sorted(projects)
 
+# Directory listings keyed by path; entries carry the directory's mtime,
+# which the kernel bumps whenever an entry is added or removed, so a
+# changed directory is a plain miss
+_dir_cache: dict[str, tuple[int, list[str]]] = {}
 
-def get_project_features(project_name: str) -> list[str]:
-    """Get all feature IDs for a project."""
-    spec_base = Path(PROJECTS_PATH) / project_name / ".spec-workflow" / "specs"
-    if not spec_base.exists():
+
+def _cached_subdirs(path: str, accept) -> list[str]:
+    """Sorted subdirectory names of path, served from the mtime cache.
+
+    os.scandir answers is_dir from the dirent data, avoiding a stat per
+    entry on the rescans that do happen.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _dir_cache.pop(path, None)
         return []
 
-    features = []
-    for item in spec_base.iterdir():
-        if item.is_dir() and item.name.startswith("FEAT-"):
-            features.append(item.name)
+    entry = _dir_cache.get(path)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+
+    with os.scandir(path) as it:
+        names = sorted(
+            e.name
+            for e in it
+            if e.is_dir(follow_symlinks=False) and accept(e.name)
+        )
+    _dir_cache[path] = (mtime, names)
+    return names
 
-    return sorted(features, reverse=True)
+
+def scan_projects() -> list[str]:
+    """Scan the projects directory for available projects."""
+    return _cached_subdirs(PROJECTS_PATH, lambda name: not name.startswith("."))
+
+
+def get_project_features(project_name: str) -> list[str]:
+    """Get all feature IDs for a project, newest first."""
+    spec_base = (
+        Path(PROJECTS_PATH) / project_name / ".spec-workflow" / "specs"
+    )
+    names = _cached_subdirs(str(spec_base), lambda name: name.startswith("FEAT-"))
+    return list(reversed(names))
 
 
 def calculate_progress(feat_id: str, project_name: str) -> float:
@@ -224,10 +365,14 @@ def calculate_progress(feat_id: str, project_name: str) -> float:
     return completed / total
 
 
+@functools.lru_cache(maxsize=4096)
 def validate_feature_id(feat_id: str) -> bool:
-    """Validate feature ID format."""
-    pattern = r"^FEAT-\d{8}-\d{3}$"
-    return bool(re.match(pattern, feat_id))
+    """Validate feature ID format.
+
+    The same handful of IDs recur across a workflow's API calls, so the
+    verdict is memoized; repeat lookups skip the regex engine entirely.
+    """
+    return _FEAT_ID_RE.match(feat_id) is not None
 
 
 def backup_spec(project_name: str, feat_id: str, phase: WorkflowPhase) -> Optional[Path]:
@@ -240,7 +385,7 @@ def backup_spec(project_name: str, feat_id: str, phase: WorkflowPhase) -> Option
     backup_dir.mkdir(exist_ok=True)
 
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    backup_file = backup_dir / f"phase-{phase.value}_{timestamp}.yaml"
+    backup_file = backup_dir / f"phase-{phase.value}_{timestamp}{phase_file.suffix}"
 
     import shutil
     shutil.copy2(phase_file, backup_file)
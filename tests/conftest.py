@@ -16,6 +16,57 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 os.environ["DATABASE_PATH"] = ":memory:"
 os.environ["PROJECTS_PATH"] = tempfile.mkdtemp()
 os.environ["ANTHROPIC_API_KEY"] = "sk-ant-test-key"
+# Test databases are throwaway: skip the fsync on every commit
+os.environ["CF_SQLITE_SYNCHRONOUS"] = "OFF"
+
+
+@pytest.fixture(scope="session")
+def db_template():
+    """Schema built once per session; tests clone it via the backup API.
+
+    A single serialized page copy replaces re-parsing the DDL in every
+    setup fixture.
+    """
+    import sqlite3
+
+    import db
+
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(db.SCHEMA)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def session_client():
+    """One TestClient over one app import for the whole session.
+
+    Building the FastAPI app and the ASGI test transport dominates
+    per-test fixture cost; tests isolate state by repointing
+    db.DATABASE_PATH and utils.PROJECTS_PATH instead.
+    """
+    from fastapi.testclient import TestClient
+
+    from main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def seed():
+    """Run a script of setup INSERTs in one executescript call.
+
+    Seeding through SQL skips the Python helpers (and their validation)
+    entirely, so tests pay one C call for their fixture rows while the
+    assertions still exercise the Python read path.
+    """
+    import db
+
+    def _seed(sql_script: str) -> None:
+        with db.get_db(write=True) as conn:
+            conn.executescript(sql_script)
+
+    return _seed
 
 
 @pytest.fixture
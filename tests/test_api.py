@@ -3,31 +3,24 @@ Tests for FastAPI endpoints.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
-
-from fastapi.testclient import TestClient
 
 
 class TestHealthEndpoint:
     """Test health check endpoint."""
 
     @pytest.fixture
-    def client(self, tmp_path):
-        """Create test client with fresh database."""
+    def client(self, tmp_path, session_client, monkeypatch):
+        """Point the shared client at a fresh database."""
         import db
         import utils
 
-        db.DATABASE_PATH = str(tmp_path / "test.db")
-        utils.PROJECTS_PATH = str(tmp_path / "projects")
+        monkeypatch.setattr(db, "DATABASE_PATH", str(tmp_path / "test.db"))
+        monkeypatch.setattr(utils, "PROJECTS_PATH", str(tmp_path / "projects"))
         (tmp_path / "projects").mkdir()
 
         db.init_db()
 
-        from main import app
-        return TestClient(app)
+        return session_client
 
     def test_health_check(self, client):
         """Test health endpoint returns ok."""
@@ -43,13 +36,13 @@ class TestProjectEndpoints:
     """Test project-related endpoints."""
 
     @pytest.fixture
-    def client(self, tmp_path):
-        """Create test client with sample projects."""
+    def client(self, tmp_path, session_client, monkeypatch):
+        """Point the shared client at sample projects."""
         import db
         import utils
 
-        db.DATABASE_PATH = str(tmp_path / "test.db")
-        utils.PROJECTS_PATH = str(tmp_path / "projects")
+        monkeypatch.setattr(db, "DATABASE_PATH", str(tmp_path / "test.db"))
+        monkeypatch.setattr(utils, "PROJECTS_PATH", str(tmp_path / "projects"))
 
         projects_dir = tmp_path / "projects"
         projects_dir.mkdir()
@@ -58,8 +51,7 @@ class TestProjectEndpoints:
 
         db.init_db()
 
-        from main import app
-        return TestClient(app)
+        return session_client
 
     def test_list_projects(self, client):
         """Test listing projects."""
@@ -87,18 +79,33 @@ class TestProjectEndpoints:
 
         assert response.status_code == 404
 
+    def test_list_project_features(self, client):
+        """Test listing features for a project."""
+        import db
+
+        project = db.register_project("sample-project", "/projects/sample-project")
+        db.create_feature("FEAT-20260129-001", project.id, "Test feature")
+
+        response = client.get("/api/projects/sample-project/features")
+
+        assert response.status_code == 200
+        data = response.json()
+        feature_ids = [f["feature_id"] for f in data["features"]]
+        assert "FEAT-20260129-001" in feature_ids
+        assert all("created_at" in f for f in data["features"])
+
 
 class TestWorkflowEndpoints:
     """Test workflow-related endpoints."""
 
     @pytest.fixture
-    def client(self, tmp_path):
-        """Create test client with sample project."""
+    def client(self, tmp_path, session_client, monkeypatch):
+        """Point the shared client at a sample project."""
         import db
         import utils
 
-        db.DATABASE_PATH = str(tmp_path / "test.db")
-        utils.PROJECTS_PATH = str(tmp_path / "projects")
+        monkeypatch.setattr(db, "DATABASE_PATH", str(tmp_path / "test.db"))
+        monkeypatch.setattr(utils, "PROJECTS_PATH", str(tmp_path / "projects"))
 
         projects_dir = tmp_path / "projects"
         projects_dir.mkdir()
@@ -107,8 +114,7 @@ class TestWorkflowEndpoints:
         db.init_db()
         db.register_project("sample-project", str(projects_dir / "sample-project"))
 
-        from main import app
-        return TestClient(app)
+        return session_client
 
     def test_start_workflow(self, client):
         """Test starting a workflow."""
@@ -144,15 +150,15 @@ class TestSpecEndpoints:
     """Test spec-related endpoints."""
 
     @pytest.fixture
-    def client_with_spec(self, tmp_path):
+    def client_with_spec(self, tmp_path, session_client, monkeypatch):
         """Create test client with a spec."""
         import db
         import utils
         from utils import write_phase_spec
         from models import PhaseStatus, WorkflowPhase
 
-        db.DATABASE_PATH = str(tmp_path / "test.db")
-        utils.PROJECTS_PATH = str(tmp_path / "projects")
+        monkeypatch.setattr(db, "DATABASE_PATH", str(tmp_path / "test.db"))
+        monkeypatch.setattr(utils, "PROJECTS_PATH", str(tmp_path / "projects"))
 
         projects_dir = tmp_path / "projects"
         projects_dir.mkdir()
@@ -171,8 +177,7 @@ class TestSpecEndpoints:
             PhaseStatus.PENDING_APPROVAL,
         )
 
-        from main import app
-        return TestClient(app)
+        return session_client
 
     def test_get_spec(self, client_with_spec):
         """Test getting spec data."""
@@ -220,13 +225,13 @@ class TestSearchEndpoint:
     """Test search functionality."""
 
     @pytest.fixture
-    def client_with_features(self, tmp_path):
+    def client_with_features(self, tmp_path, session_client, monkeypatch):
         """Create test client with multiple features."""
         import db
         import utils
 
-        db.DATABASE_PATH = str(tmp_path / "test.db")
-        utils.PROJECTS_PATH = str(tmp_path / "projects")
+        monkeypatch.setattr(db, "DATABASE_PATH", str(tmp_path / "test.db"))
+        monkeypatch.setattr(utils, "PROJECTS_PATH", str(tmp_path / "projects"))
 
         projects_dir = tmp_path / "projects"
         projects_dir.mkdir()
@@ -237,8 +242,7 @@ class TestSearchEndpoint:
         db.create_feature("FEAT-20260129-001", project.id, "Auth feature")
         db.create_feature("FEAT-20260129-002", project.id, "API feature")
 
-        from main import app
-        return TestClient(app)
+        return session_client
 
     def test_search_specs(self, client_with_features):
         """Test searching specs."""
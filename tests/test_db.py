@@ -3,14 +3,10 @@ Tests for database operations.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+import uuid
 
 from db import (
     get_db,
-    init_db,
     register_project,
     get_project,
     list_projects,
@@ -28,11 +24,19 @@ class TestDatabase:
     """Test database operations."""
 
     @pytest.fixture(autouse=True)
-    def setup_db(self, tmp_path):
-        """Set up fresh database for each test."""
+    def setup_db(self, db_template, monkeypatch):
+        """Clone the session schema template into a fresh in-memory database.
+
+        The connection pool holds the shared-cache DB open for the
+        test's lifetime; a unique name per test keeps schemas isolated
+        without touching disk.
+        """
         import db
-        db.DATABASE_PATH = str(tmp_path / "test.db")
-        init_db()
+        monkeypatch.setattr(
+            db, "DATABASE_PATH", f"file:memdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        )
+        with db.get_db(write=True) as conn:
+            db_template.backup(conn)
 
     def test_register_project(self):
         """Test project registration."""
@@ -62,10 +66,14 @@ class TestDatabase:
         project = get_project("nonexistent")
         assert project is None
 
-    def test_list_projects(self):
+    def test_list_projects(self, seed):
         """Test listing all projects."""
-        register_project("project-a", "/projects/a")
-        register_project("project-b", "/projects/b")
+        seed(
+            """
+            INSERT INTO projects (name, path, status) VALUES ('project-a', '/projects/a', 'active');
+            INSERT INTO projects (name, path, status) VALUES ('project-b', '/projects/b', 'active');
+            """
+        )
 
         projects = list_projects()
 
@@ -111,10 +119,14 @@ class TestDatabase:
         assert feature.status == PhaseStatus.IN_PROGRESS
         assert feature.current_phase == WorkflowPhase.DESIGN
 
-    def test_add_and_get_logs(self):
+    def test_add_and_get_logs(self, seed):
         """Test adding and retrieving logs."""
-        project = register_project("test", "/projects/test")
-        create_feature("FEAT-20260129-001", project.id, "Test feature")
+        seed(
+            """
+            INSERT INTO projects (id, name, path, status) VALUES (1, 'test', '/projects/test', 'active');
+            INSERT INTO features (feature_id, project_id, description) VALUES ('FEAT-20260129-001', 1, 'Test feature');
+            """
+        )
 
         add_log("FEAT-20260129-001", "Test message 1", "info")
         add_log("FEAT-20260129-001", "Test message 2", "error")
@@ -126,6 +138,87 @@ class TestDatabase:
         assert "Test message 1" in messages
         assert "Test message 2" in messages
 
+    def test_add_log_batch_large(self, seed):
+        """Test that a large batch lands intact via the multi-row path."""
+        from datetime import datetime
+
+        from db import add_log_batch
+
+        seed(
+            """
+            INSERT INTO projects (id, name, path, status) VALUES (1, 'test', '/projects/test', 'active');
+            INSERT INTO features (feature_id, project_id, description) VALUES ('FEAT-20260129-001', 1, 'Test feature');
+            """
+        )
+
+        now = datetime.utcnow()
+        add_log_batch(
+            [
+                ("FEAT-20260129-001", now, f"Message {i}", "info")
+                for i in range(1000)
+            ]
+        )
+
+        logs = get_logs("FEAT-20260129-001", limit=1000)
+        assert len(logs) == 1000
+
+    def test_init_db_migrates_legacy_schema(self, tmp_path, monkeypatch):
+        """init_db rebuilds a pre-feature_pk database in place."""
+        import sqlite3
+
+        import db
+
+        legacy = tmp_path / "legacy.db"
+        conn = sqlite3.connect(legacy)
+        conn.executescript(
+            """
+            CREATE TABLE projects (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL,
+                path TEXT NOT NULL,
+                status TEXT DEFAULT 'active',
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE features (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                feature_id TEXT UNIQUE NOT NULL,
+                project_id INTEGER NOT NULL,
+                description TEXT,
+                status TEXT DEFAULT 'draft',
+                current_phase TEXT DEFAULT 'requirements',
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (project_id) REFERENCES projects(id)
+            );
+            CREATE TABLE logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                feature_id TEXT NOT NULL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                message TEXT,
+                level TEXT DEFAULT 'info',
+                FOREIGN KEY (feature_id) REFERENCES features(feature_id)
+            );
+            CREATE INDEX idx_logs_feature ON logs(feature_id);
+            CREATE INDEX idx_logs_timestamp ON logs(timestamp);
+            INSERT INTO projects (name, path) VALUES ('test', '/projects/test');
+            INSERT INTO features (feature_id, project_id, description)
+                VALUES ('FEAT-20260129-001', 1, 'Legacy feature');
+            INSERT INTO logs (feature_id, message, level)
+                VALUES ('FEAT-20260129-001', 'Old message', 'info');
+            """
+        )
+        conn.commit()
+        conn.close()
+
+        monkeypatch.setattr(db, "DATABASE_PATH", str(legacy))
+        db.init_db()
+
+        logs = db.get_logs("FEAT-20260129-001")
+        assert [log.message for log in logs] == ["Old message"]
+
+        feature = db.get_feature("FEAT-20260129-001")
+        assert feature is not None
+        assert feature.description == "Legacy feature"
+
     def test_feature_number_increment(self):
         """Test that feature numbers increment correctly."""
         num1 = get_next_feature_number()
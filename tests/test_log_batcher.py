@@ -0,0 +1,51 @@
+"""
+Tests for the debounced log write-batcher.
+"""
+
+import pytest
+
+from db import create_feature, get_logs, init_db, register_project
+from log_batcher import LogBatcher
+
+
+class TestLogBatcher:
+    """Test batched log writes."""
+
+    @pytest.fixture(autouse=True)
+    def setup_db(self, tmp_path, monkeypatch):
+        """Set up fresh database with a feature for each test."""
+        import db
+        monkeypatch.setattr(db, "DATABASE_PATH", str(tmp_path / "test.db"))
+        init_db()
+        project = register_project("test", "/projects/test")
+        create_feature("FEAT-20260129-001", project.id, "Test feature")
+
+    def test_flush_writes_pending_rows(self):
+        """Test that flush writes all queued rows in one batch."""
+        batcher = LogBatcher(flush_interval=60)
+        batcher.add("FEAT-20260129-001", "Message 1")
+        batcher.add("FEAT-20260129-001", "Message 2")
+
+        batcher.flush()
+
+        logs = get_logs("FEAT-20260129-001")
+        assert len(logs) == 2
+        assert batcher.pending == 0
+
+    def test_full_batch_flushes_immediately(self):
+        """Test that reaching max_batch triggers a flush without waiting."""
+        batcher = LogBatcher(flush_interval=60, max_batch=3)
+        for i in range(3):
+            batcher.add("FEAT-20260129-001", f"Message {i}")
+
+        logs = get_logs("FEAT-20260129-001")
+        assert len(logs) == 3
+
+    def test_error_level_bypasses_debounce(self):
+        """Test that error logs are flushed synchronously."""
+        batcher = LogBatcher(flush_interval=60)
+        batcher.add("FEAT-20260129-001", "Something broke", level="error")
+
+        logs = get_logs("FEAT-20260129-001")
+        assert len(logs) == 1
+        assert logs[0].level == "error"
@@ -4,10 +4,6 @@ Tests for Pydantic models.
 
 import pytest
 from datetime import datetime
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
 from models import (
     Approval,
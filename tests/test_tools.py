@@ -3,20 +3,16 @@ Tests for CrewAI tools.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
 
 class TestFileTools:
     """Test file operation tools."""
 
     @pytest.fixture
-    def temp_projects(self, tmp_path):
+    def temp_projects(self, tmp_path, monkeypatch):
         """Set up temporary projects directory."""
         import tools
-        tools.PROJECTS_PATH = str(tmp_path)
+        monkeypatch.setattr(tools, "PROJECTS_PATH", str(tmp_path))
 
         # Create sample file
         project_dir = tmp_path / "test-project"
@@ -114,10 +110,10 @@ class TestDockerTools:
     """Test Docker validation tools."""
 
     @pytest.fixture
-    def temp_projects(self, tmp_path):
+    def temp_projects(self, tmp_path, monkeypatch):
         """Set up temporary projects directory."""
         import tools
-        tools.PROJECTS_PATH = str(tmp_path)
+        monkeypatch.setattr(tools, "PROJECTS_PATH", str(tmp_path))
 
         project_dir = tmp_path / "test-project"
         project_dir.mkdir()
@@ -0,0 +1,61 @@
+"""
+Tests for per-workflow tool result caching.
+"""
+
+import pytest
+
+
+class TestToolsCached:
+    """Test the per-feature tool result cache."""
+
+    @pytest.fixture(autouse=True)
+    def temp_projects(self, tmp_path, monkeypatch):
+        """Point tools at a temp projects dir and start with an empty cache."""
+        import tools
+        import tools_cached
+
+        monkeypatch.setattr(tools, "PROJECTS_PATH", str(tmp_path))
+        tools_cached._cache.clear()
+
+        project_dir = tmp_path / "test-project"
+        project_dir.mkdir()
+        (project_dir / "test.txt").write_text("Hello, World!")
+
+        token = tools_cached.current_feat_id.set("FEAT-20260129-001")
+        yield tmp_path
+        tools_cached.current_feat_id.reset(token)
+
+    def test_repeated_read_served_from_cache(self, temp_projects):
+        """Second read of the same path should not hit the filesystem."""
+        from tools_cached import read_file, _cache
+
+        first = read_file.run("test-project/test.txt")
+        assert "Hello, World!" in first
+        assert len(_cache) == 1
+
+        # Change the file behind the cache's back; a cached read won't see it
+        (temp_projects / "test-project" / "test.txt").write_text("changed")
+        second = read_file.run("test-project/test.txt")
+        assert second == first
+
+    def test_write_invalidates_cached_entries(self, temp_projects):
+        """Writing a file drops cached reads of it and listings of its parents."""
+        from tools_cached import list_directory, read_file, write_file
+
+        read_file.run("test-project/test.txt")
+        listing = list_directory.run("test-project")
+        assert "test.txt" in listing
+
+        write_file.run("test-project/test.txt", "changed")
+
+        assert "changed" in read_file.run("test-project/test.txt")
+
+    def test_no_feat_id_bypasses_cache(self, temp_projects):
+        """Outside a workflow context the tools pass straight through."""
+        import tools_cached
+        from tools_cached import read_file, _cache
+
+        tools_cached.current_feat_id.set(None)
+        read_file.run("test-project/test.txt")
+
+        assert len(_cache) == 0
@@ -3,10 +3,7 @@ Tests for utility functions.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+import uuid
 
 from utils import (
     generate_feat_id,
@@ -25,11 +22,14 @@ class TestFeatureId:
     """Test feature ID generation and validation."""
 
     @pytest.fixture(autouse=True)
-    def setup_db(self, tmp_path):
-        """Set up fresh database for each test."""
+    def setup_db(self, db_template, monkeypatch):
+        """Clone the session schema template into a fresh in-memory database."""
         import db
-        db.DATABASE_PATH = str(tmp_path / "test.db")
-        db.init_db()
+        monkeypatch.setattr(
+            db, "DATABASE_PATH", f"file:memdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        )
+        with db.get_db(write=True) as conn:
+            db_template.backup(conn)
 
     def test_generate_feat_id_format(self):
         """Test that generated IDs have correct format."""
@@ -60,10 +60,10 @@ class TestSpecOperations:
     """Test spec file operations."""
 
     @pytest.fixture
-    def temp_projects(self, tmp_path):
+    def temp_projects(self, tmp_path, monkeypatch):
         """Set up temporary projects directory."""
         import utils
-        utils.PROJECTS_PATH = str(tmp_path)
+        monkeypatch.setattr(utils, "PROJECTS_PATH", str(tmp_path))
         return tmp_path
 
     def test_get_spec_dir(self, temp_projects):
@@ -105,6 +105,34 @@ class TestSpecOperations:
         assert read_spec.feature_id == spec.feature_id
         assert read_spec.content == spec.content
 
+    def test_read_phase_spec_served_from_cache(self, temp_projects):
+        """Unchanged specs are served from the parse cache; writes invalidate."""
+        write_phase_spec(
+            "test-project",
+            "FEAT-20260129-001",
+            WorkflowPhase.REQUIREMENTS,
+            "## Requirements",
+        )
+
+        first = read_phase_spec(
+            "test-project", "FEAT-20260129-001", WorkflowPhase.REQUIREMENTS
+        )
+        second = read_phase_spec(
+            "test-project", "FEAT-20260129-001", WorkflowPhase.REQUIREMENTS
+        )
+        assert second is first
+
+        write_phase_spec(
+            "test-project",
+            "FEAT-20260129-001",
+            WorkflowPhase.REQUIREMENTS,
+            "## Requirements\n- Changed",
+        )
+        third = read_phase_spec(
+            "test-project", "FEAT-20260129-001", WorkflowPhase.REQUIREMENTS
+        )
+        assert "Changed" in third.content
+
     def test_read_nonexistent_spec(self, temp_projects):
         """Test reading non-existent spec returns None."""
         spec = read_phase_spec(
@@ -120,10 +148,10 @@ class TestProjectScanning:
     """Test project scanning functionality."""
 
     @pytest.fixture
-    def temp_projects(self, tmp_path):
+    def temp_projects(self, tmp_path, monkeypatch):
         """Set up temporary projects directory with sample projects."""
         import utils
-        utils.PROJECTS_PATH = str(tmp_path)
+        monkeypatch.setattr(utils, "PROJECTS_PATH", str(tmp_path))
 
         # Create some sample project directories
         (tmp_path / "project-a").mkdir()
@@ -141,10 +169,10 @@ class TestProjectScanning:
         assert "project-b" in projects
         assert ".hidden" not in projects
 
-    def test_scan_empty_directory(self, tmp_path):
+    def test_scan_empty_directory(self, tmp_path, monkeypatch):
         """Test scanning empty directory."""
         import utils
-        utils.PROJECTS_PATH = str(tmp_path)
+        monkeypatch.setattr(utils, "PROJECTS_PATH", str(tmp_path))
 
         projects = scan_projects()
         assert projects == []